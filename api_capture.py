@@ -0,0 +1,217 @@
+"""Capture and replay the JSON API calls made by the FloGrappling events page.
+
+The events page is rendered client side from XHR/fetch responses. Recording
+those responses lets us read the structured event data directly instead of
+scraping the DOM, and lets later runs replay the same requests with a plain
+HTTP client without starting a browser at all.
+"""
+import datetime
+import json
+import os
+import urllib.parse
+
+from event_dates import parse_date
+
+SITE_URL = "https://www.flograppling.com"
+
+# Keys that the event JSON uses (or is likely to use) for each field
+TITLE_KEYS = ("title", "name", "eventName", "event_name")
+DATE_KEYS = ("startDateTime", "startDate", "start_date", "startTime", "start_time", "start", "date")
+LOCATION_KEYS = ("location", "venue", "venueName", "venue_name", "address")
+LINK_KEYS = ("url", "link", "permalink", "canonicalUrl", "canonical_url", "slug")
+
+# Request headers that must not be replayed verbatim
+SKIPPED_HEADERS = {"content-length", "host", "cookie", "connection", "accept-encoding"}
+
+
+class ApiCapture:
+    """Record the JSON responses a page receives while it loads."""
+
+    def __init__(self):
+        self.responses = []
+
+    def on_response(self, response):
+        """Playwright ``response`` event handler."""
+        if response.request.resource_type not in ("xhr", "fetch"):
+            return
+        if "json" not in response.headers.get("content-type", ""):
+            return
+        self.responses.append(response)
+
+    async def collect(self):
+        """Return ``(request_spec, payload)`` pairs for every recorded response."""
+        captured = []
+        for response in self.responses:
+            try:
+                payload = await response.json()
+            except Exception as e:
+                print(f"Could not read JSON from {response.url}: {e}")
+                continue
+            captured.append((request_spec(response.request), payload))
+        return captured
+
+
+def request_spec(request):
+    """Describe a Playwright request so it can be replayed later."""
+    return {
+        "url": request.url,
+        "method": request.method,
+        "headers": {
+            name: value for name, value in request.headers.items()
+            if not name.startswith(":") and name.lower() not in SKIPPED_HEADERS
+        },
+        "post_data": request.post_data,
+    }
+
+
+def _first(obj, keys):
+    return _first_item(obj, keys)[1]
+
+
+def _first_item(obj, keys):
+    for key in keys:
+        value = obj.get(key)
+        if value:
+            return key, value
+    return None, None
+
+
+def _location_text(value):
+    if isinstance(value, dict):
+        parts = [_first(value, ("name", "venueName", "title"))]
+        parts.append(", ".join(
+            str(value[key]) for key in ("city", "state", "region", "country") if value.get(key)
+        ))
+        return " - ".join(part for part in parts if part)
+    if isinstance(value, str):
+        return value
+    return ""
+
+
+def _split_datetime(value):
+    """Split an ISO-ish timestamp into the ``dateText``/``time`` pair the DOM path produces."""
+    value = str(value)
+    if "T" not in value:
+        return value, ""
+    date_part, time_part = value.split("T", 1)
+    time_text = time_part[:5] if ":" in time_part[:5] else ""
+    if time_text and time_part.endswith("Z"):
+        time_text += " UTC"
+    return date_part, time_text
+
+
+def _is_event(obj, date_key, date_text):
+    """Whether an object with a title and a date is an event rather than,
+    say, an article or a video: its date must parse, and a plain ``date``
+    (which articles have too) only counts next to a location or an Event
+    type."""
+    if parse_date(date_text, datetime.date.today()) is None:
+        return False
+    if date_key != "date":
+        return True
+    return bool(_first(obj, LOCATION_KEYS)) or "Event" in str(obj.get("@type", ""))
+
+
+def _event_link(link, page_url):
+    if not isinstance(link, str) or not link:
+        return page_url
+    if link.startswith("http"):
+        return link
+    if link.startswith("/") or "/" in link:
+        # A path such as "/events/123" or "news/123", relative to the site
+        return urllib.parse.urljoin(SITE_URL + "/", link)
+    # A bare slug
+    return urllib.parse.urljoin(SITE_URL + "/events/", link)
+
+
+def _event_info(obj, page_url):
+    title = _first(obj, TITLE_KEYS)
+    date_key, start = _first_item(obj, DATE_KEYS)
+    if not isinstance(title, str) or not isinstance(start, str):
+        return None
+
+    date_text, time_text = _split_datetime(start)
+    if not _is_event(obj, date_key, date_text):
+        return None
+    link = _event_link(_first(obj, LINK_KEYS), page_url)
+
+    return {
+        "title": title.strip(),
+        "location": _location_text(_first(obj, LOCATION_KEYS)),
+        "time": time_text,
+        "dateText": date_text,
+        "link": link,
+    }
+
+
+def parse_api_events(payload, page_url=""):
+    """Find event-like objects anywhere in a JSON payload.
+
+    An object counts if it has a title and a start date that parses (see
+    ``_is_event``); anything else is searched for nested events.
+
+    Returns a list of dicts in the same shape as the DOM extraction script
+    (``title``, ``location``, ``time``, ``dateText``, ``link``).
+    """
+    found = []
+    seen = set()
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(reversed(node))
+        elif isinstance(node, dict):
+            info = _event_info(node, page_url)
+            if info:
+                key = (info["title"], info["dateText"])
+                if key not in seen:
+                    seen.add(key)
+                    found.append(info)
+                continue
+            stack.extend(reversed(list(node.values())))
+    return found
+
+
+class ApiRequestStore:
+    """Persist the API requests that produced events, keyed by month."""
+
+    def __init__(self, path="cache/api_requests.json"):
+        self.path = path
+        self.requests = {}
+        if os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    self.requests = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Ignoring unreadable API request store {path}: {e}")
+
+    def get(self, date):
+        return self.requests.get(date, [])
+
+    def put(self, date, specs):
+        self.requests[date] = specs
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(self.requests, f, indent=2, sort_keys=True)
+
+
+def replay_requests(session, specs, page_url="", timeout=30):
+    """Re-issue recorded API requests over HTTP and parse their event JSON.
+
+    ``session`` is a ``requests.Session``. This is blocking; run it in a
+    worker thread from async code.
+    """
+    events = []
+    for spec in specs:
+        response = session.request(
+            spec["method"],
+            spec["url"],
+            headers=spec.get("headers") or {},
+            data=spec.get("post_data"),
+            timeout=timeout,
+        )
+        response.raise_for_status()
+        events.extend(parse_api_events(response.json(), page_url))
+    return events
@@ -0,0 +1,159 @@
+"""Multi-process backfill of many months across several facet queries.
+
+The (month, facet query) work list is sharded across a process pool. Each
+worker process runs its own scraper, browser and page pool, and appends every
+month it finishes to its own JSON-lines file in the spool directory, flushed
+to disk as it goes. The spool doubles as the checkpoint: a month already in
+it is not fetched again, so an interrupted backfill picks up where it left
+off. Only the parent process writes to the event store, by merging the spool
+once the workers are done.
+"""
+import argparse
+import asyncio
+import concurrent.futures
+import datetime
+import glob
+import json
+import multiprocessing
+import os
+import shutil
+
+from event_dates import ensure_utc
+from month_cache import facets_hash
+
+SPOOL_DIR = "cache/backfill"
+
+
+def month_range(start, end):
+    """First days (``YYYY-MM-DD``) of the months from ``start`` to ``end``, given as ``YYYY-MM``."""
+    current = datetime.date.fromisoformat(f"{start}-01")
+    last = datetime.date.fromisoformat(f"{end}-01")
+    dates = []
+    while current <= last:
+        dates.append(current.isoformat())
+        current = (current + datetime.timedelta(days=32)).replace(day=1)
+    return dates
+
+
+class Spool:
+    """Directory of JSON-lines files, one record per finished month."""
+
+    def __init__(self, directory=SPOOL_DIR):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def reset(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def part_path(self, run, index):
+        return os.path.join(self.directory, f"part-{run}-{index}.jsonl")
+
+    def records(self):
+        for path in sorted(glob.glob(os.path.join(self.directory, "*.jsonl"))):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        # A line cut short by an interrupted worker
+                        continue
+
+    def done(self):
+        """``(date, facets_hash)`` of every month already in the spool."""
+        return {(record["date"], record["facets_hash"]) for record in self.records()}
+
+    def results(self):
+        """``(facets, events)`` for every spooled month, with parsed dates."""
+        for record in self.records():
+            events = [
+                dict(event, pubDate=ensure_utc(datetime.datetime.fromisoformat(event["pubDate"])))
+                for event in record["events"]
+            ]
+            yield record["facets"], events
+
+
+def _record(date, facets, events):
+    return json.dumps({
+        "date": date,
+        "facets_hash": facets_hash(facets),
+        "facets": facets,
+        "events": [dict(event, pubDate=event["pubDate"].isoformat()) for event in events],
+    })
+
+
+async def _run_worker(args, items, spool_path):
+    from scraper import build_scraper
+
+    scraper = build_scraper(args)
+    session = scraper.browser_session()
+    scraper.open_http()
+    by_query = {}
+    for date, facets in items:
+        by_query.setdefault(facets_hash(facets), (facets, []))[1].append(date)
+
+    finished = 0
+    try:
+        with open(spool_path, "a", encoding="utf-8") as spool:
+            for facets, dates in by_query.values():
+                for start in range(0, len(dates), scraper.concurrency):
+                    batch = dates[start:start + scraper.concurrency]
+                    results = await scraper.fetch_months(session, batch, facets)
+                    for date, events in zip(batch, results):
+                        # Failed months are left out, so the next run retries them
+                        if not scraper.metrics.month(scraper.month_key(date, facets)).get("error"):
+                            spool.write(_record(date, facets, events) + "\n")
+                            finished += 1
+                    spool.flush()
+                    os.fsync(spool.fileno())
+                    if scraper.breaker.tripped:
+                        return finished
+    finally:
+        await session.close()
+        scraper.close_http()
+        await scraper.debug_artifacts.flush()
+    return finished
+
+
+def run_worker(args, items, spool_path):
+    """Process pool entry point: fetch ``items``, a list of ``(date, facets)``."""
+    return asyncio.run(_run_worker(args, items, spool_path))
+
+
+def run_backfill(args, queries, spool):
+    """Fetch every month from ``args.backfill`` for ``queries`` that is not in
+    ``spool`` yet, over ``args.workers`` processes."""
+    start, end = args.backfill
+    done = spool.done()
+    work = [
+        (date, facets)
+        for facets in queries
+        for date in month_range(start, end)
+        if (date, facets_hash(facets)) not in done
+    ]
+    print(f"Backfill {start} to {end}: {len(done)} months already spooled, {len(work)} to fetch")
+    if not work:
+        return 0
+
+    workers = max(1, min(args.workers, len(work)))
+    worker_args = argparse.Namespace(**vars(args))
+    # Every process rate limits on its own, so spread the budget between them
+    worker_args.min_request_interval = args.min_request_interval * workers
+    # Workers must not write to the shared SQLite cache or API request store
+    worker_args.no_cache = True
+    worker_args.api_mode = "off"
+
+    run = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
+    finished = 0
+    context = multiprocessing.get_context("spawn")
+    with concurrent.futures.ProcessPoolExecutor(workers, mp_context=context) as pool:
+        futures = [
+            pool.submit(run_worker, worker_args, work[index::workers], spool.part_path(run, index))
+            for index in range(workers)
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            finished += future.result()
+            print(f"Backfill worker done, {finished} of {len(work)} months spooled so far")
+    if finished < len(work):
+        print(f"{len(work) - finished} months failed or were skipped; run the backfill again to retry them")
+    return finished
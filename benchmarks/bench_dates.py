@@ -0,0 +1,120 @@
+"""Micro-benchmark for date/time parsing of scraped events.
+
+Compares the original per-event ``strptime`` loop with ``event_dates``
+on a synthetic month where, as on the real page, many events share the
+same few date headers. Before timing anything it checks that
+``event_dates`` gets a set of known cases right, and exits with status 1
+if it does not.
+
+Usage: python benchmarks/bench_dates.py [--events N] [--repeat N] [--check-only]
+"""
+import argparse
+import datetime
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import event_dates
+
+
+UTC = datetime.timezone.utc
+
+# (date text, time text, scraped month, expected UTC datetime, date known)
+CASES = [
+    ("March 19, 2025", "8:30 AM CDT", "2025-03-01", datetime.datetime(2025, 3, 19, 13, 30, tzinfo=UTC), True),
+    # Evening in the US is the next day in UTC
+    ("March 19, 2025", "8:30 PM CDT", "2025-03-01", datetime.datetime(2025, 3, 20, 1, 30, tzinfo=UTC), True),
+    # The zone of a range is only written after its end time
+    ("March 19, 2025", "8:30 AM - 5:00 PM CDT", "2025-03-01",
+     datetime.datetime(2025, 3, 19, 13, 30, tzinfo=UTC), True),
+    # Generic zones follow daylight saving time
+    ("Wednesday, March 19", "9 PM ET", "2025-03-01", datetime.datetime(2025, 3, 20, 1, 0, tzinfo=UTC), True),
+    ("Wednesday, January 15", "9 PM ET", "2025-01-01", datetime.datetime(2025, 1, 16, 2, 0, tzinfo=UTC), True),
+    ("03/19/2025", "13:30 UTC", "2025-03-01", datetime.datetime(2025, 3, 19, 13, 30, tzinfo=UTC), True),
+    ("2025-03-19", "", "2025-03-01", datetime.datetime(2025, 3, 19, tzinfo=UTC), True),
+    # Multi-day events start on their first day
+    ("Mar 19 - 21, 2025", "", "2025-03-01", datetime.datetime(2025, 3, 19, tzinfo=UTC), True),
+    ("Mar 30 - Apr 2, 2025", "10:00 AM EDT", "2025-03-01", datetime.datetime(2025, 3, 30, 14, 0, tzinfo=UTC), True),
+    # Dates without a year are placed next to the scraped month
+    ("Dec 31", "", "2025-03-01", datetime.datetime(2024, 12, 31, tzinfo=UTC), True),
+    ("Jan 2", "", "2024-11-01", datetime.datetime(2025, 1, 2, tzinfo=UTC), True),
+    # Unparseable dates fall back to the first of the scraped month
+    ("TBA", "7:00 PM", "2025-03-01", datetime.datetime(2025, 3, 1, 19, 0, tzinfo=UTC), False),
+    ("", "", "2025-03-01", datetime.datetime(2025, 3, 1, tzinfo=UTC), False),
+]
+
+
+def check():
+    """Parse every case in ``CASES``; returns the number of wrong results."""
+    failures = 0
+    for date_text, time_text, month, expected, known in CASES:
+        result = event_dates.parse_event_datetime(date_text, time_text, month)
+        if result != (expected, known):
+            failures += 1
+            print(f"FAIL {date_text!r} {time_text!r} in {month}: got {result}, expected {(expected, known)}")
+    print(f"{len(CASES) - failures} of {len(CASES)} parsing checks passed")
+    return failures
+
+
+def legacy_parse(date_text, time_text):
+    """The parsing that used to live in ``fetch_events_for_month``."""
+    event_date = datetime.datetime.now()
+    if date_text:
+        for fmt in ("%B %d, %Y", "%b %d, %Y", "%Y-%m-%d", "%m/%d/%Y"):
+            try:
+                event_date = datetime.datetime.strptime(date_text, fmt)
+                break
+            except ValueError:
+                continue
+    if time_text and ":" in time_text:
+        try:
+            time_parts = time_text.split()
+            am_pm = time_parts[1].upper() if len(time_parts) > 1 else ""
+            hour, minute = map(int, time_parts[0].split(":")[:2])
+            if "PM" in am_pm and hour < 12:
+                hour += 12
+            elif "AM" in am_pm and hour == 12:
+                hour = 0
+            event_date = event_date.replace(hour=hour, minute=minute)
+        except Exception:
+            pass
+    return event_date
+
+
+def synthetic_month(count):
+    random.seed(1)
+    headers = [f"March {day}, 2025" for day in range(1, 29, 3)]
+    headers += [f"Mar {day}, 2025" for day in range(2, 29, 5)]
+    times = ["8:30 AM CDT", "10:00 AM EDT", "1:00 PM PDT", "9:00 AM", "12:15 PM CST"]
+    return [(random.choice(headers), random.choice(times)) for _ in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=200, help="events per month")
+    parser.add_argument("--repeat", type=int, default=200, help="months parsed per timing")
+    parser.add_argument("--check-only", action="store_true", help="only run the parsing checks")
+    args = parser.parse_args()
+
+    if check():
+        sys.exit(1)
+    if args.check_only:
+        return
+
+    pairs = synthetic_month(args.events)
+    candidates = {
+        "legacy strptime loop": lambda: [legacy_parse(d, t) for d, t in pairs],
+        "event_dates.parse_month": lambda: event_dates.parse_month(pairs, "2025-03-01"),
+    }
+    total = args.events * args.repeat
+    print(f"{'parser':<26} {'seconds':>8} {'events/sec':>12}")
+    for name, func in candidates.items():
+        best = min(timeit.repeat(func, number=args.repeat, repeat=3))
+        print(f"{name:<26} {best:>8.3f} {total / best:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
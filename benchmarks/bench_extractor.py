@@ -0,0 +1,90 @@
+"""Benchmark the DOM extraction scripts against saved HTML fixtures.
+
+Loads each fixture into a headless Chromium page and times every extractor
+version in ``extractor.EXTRACTORS`` in the page, reporting the median and best
+time per call and how many events each version found. Every version must
+return the same rows as v1 on every fixture; the script exits with status 1
+and prints the differing rows when one does not.
+
+Usage: python benchmarks/bench_extractor.py [--iterations N] [fixture.html ...]
+"""
+import argparse
+import asyncio
+import glob
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from playwright.async_api import async_playwright
+
+from extractor import EXTRACTORS
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+async def time_extractor(page, extractor, iterations):
+    payload = await page.evaluate(extractor.source)  # Warm up the JIT
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await page.evaluate(extractor.source)
+        timings.append(time.perf_counter() - started)
+    return extractor.decode(payload), timings
+
+
+def rows(events, page_url):
+    """Comparable rows; v1 links to the page itself where v2 leaves the link empty."""
+    return [
+        (e["title"], e["location"], e["time"], e["dateText"],
+         "" if e["link"] == page_url else e["link"])
+        for e in events
+    ]
+
+
+async def run(fixtures, iterations):
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        page = await browser.new_page()
+        mismatches = 0
+
+        print(f"{'fixture':<24} {'extractor':<10} {'events':>6} {'median ms':>10} {'best ms':>8}")
+        for path in fixtures:
+            with open(path, encoding="utf-8") as f:
+                await page.set_content(f.read(), wait_until="domcontentloaded")
+            name = os.path.basename(path)
+            found = {}
+            for version, extractor in sorted(EXTRACTORS.items()):
+                events, timings = await time_extractor(page, extractor, iterations)
+                found[version] = rows(events, page.url)
+                print(f"{name:<24} {version:<10} {len(events):>6} "
+                      f"{statistics.median(timings) * 1000:>10.2f} {min(timings) * 1000:>8.2f}")
+            for version, version_rows in sorted(found.items()):
+                if version_rows != found["v1"]:
+                    mismatches += 1
+                    print(f"MISMATCH {name}: {version} differs from v1")
+                    for row in found["v1"]:
+                        if row not in version_rows:
+                            print(f"  only in v1:  {row}")
+                    for row in version_rows:
+                        if row not in found["v1"]:
+                            print(f"  only in {version}: {row}")
+
+        await browser.close()
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("fixtures", nargs="*")
+    args = parser.parse_args()
+    fixtures = args.fixtures or sorted(glob.glob(os.path.join(FIXTURES_DIR, "*.html")))
+    if asyncio.run(run(fixtures, args.iterations)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
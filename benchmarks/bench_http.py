@@ -0,0 +1,47 @@
+"""Benchmark the browser-free HTML parser against saved HTML fixtures.
+
+Times ``http_backend.extract_events`` on each fixture, the work the HTTP
+backend does per month once the page has been downloaded, and reports the
+median and best time per call and how many events were found. Compare with
+``bench_extractor.py``, which times the same extraction inside Chromium.
+
+Usage: python benchmarks/bench_http.py [--iterations N] [fixture.html ...]
+"""
+import argparse
+import glob
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from http_backend import PARSER, extract_events
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+PAGE_URL = "https://www.flograppling.com/events"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("fixtures", nargs="*")
+    args = parser.parse_args()
+    fixtures = args.fixtures or sorted(glob.glob(os.path.join(FIXTURES_DIR, "*.html")))
+
+    print(f"parser: {PARSER}")
+    print(f"{'fixture':<24} {'source':<10} {'events':>6} {'median ms':>10} {'best ms':>8}")
+    for path in fixtures:
+        with open(path, encoding="utf-8") as f:
+            html = f.read()
+        timings = []
+        for _ in range(args.iterations):
+            started = time.perf_counter()
+            events, source = extract_events(html, PAGE_URL)
+            timings.append(time.perf_counter() - started)
+        print(f"{os.path.basename(path):<24} {source:<10} {len(events):>6} "
+              f"{statistics.median(timings) * 1000:>10.2f} {min(timings) * 1000:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
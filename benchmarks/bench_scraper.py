@@ -0,0 +1,110 @@
+"""Benchmark the scraping pipeline offline from recorded month pages.
+
+Replays HTML snapshots (recorded with ``scraper.py --record`` or, by default,
+the fixtures in ``benchmarks/fixtures``) through ``fetch_events_for_month``
+and reports per-month latency, time to ready, extraction time and events/sec.
+It then times ``create_rss_feed`` on synthetic event lists of growing size.
+Nothing is fetched from the network and nothing is written to the repo.
+
+Usage: python benchmarks/bench_scraper.py [--recordings DIR] [--concurrency N]
+"""
+import argparse
+import asyncio
+import datetime
+import glob
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+from playwright.async_api import async_playwright
+
+from recording import ReplayServer, snapshot_path
+from scraper import BrowserSession, FloGrapplingEventScraper
+
+FIXTURES_DIR = os.path.join(REPO_DIR, "benchmarks", "fixtures")
+
+
+def recordings_from_fixtures(directory, facets):
+    """Lay the fixture pages out as recordings for consecutive months."""
+    for month, path in enumerate(sorted(glob.glob(os.path.join(FIXTURES_DIR, "*.html"))), start=1):
+        date = f"2025-{month:02d}-01"
+        shutil.copyfile(path, snapshot_path(directory, date, facets))
+
+
+async def bench_fetch(recordings, concurrency):
+    replay = ReplayServer(recordings)
+    scraper = FloGrapplingEventScraper(concurrency=concurrency, min_request_interval=0, replay=replay,
+                                       backend="browser")
+    dates = replay.recorded_dates(scraper.facets)
+
+    async with async_playwright() as p:
+        session = BrowserSession(p, [replay], [scraper.extractor.init_script])
+        await session.context()  # Keep browser startup out of the timings
+        started = time.perf_counter()
+        results = await scraper.fetch_months(session, dates)
+        elapsed = time.perf_counter() - started
+        await session.close()
+
+    print(f"\nfetch_events_for_month ({len(dates)} months, concurrency {concurrency})")
+    print(f"{'month':<12} {'events':>6} {'total s':>8} {'ready s':>8} {'extract ms':>11}")
+    for date in dates:
+        stats = scraper.month_stats.get(date, {})
+        print(f"{date:<12} {stats.get('events', 0):>6} {stats.get('fetch_time', 0):>8.3f} "
+              f"{stats.get('time_to_ready', 0):>8.3f} {stats.get('timings', {}).get('evaluate', 0) * 1000:>11.2f}")
+    total_events = sum(len(events) for events in results)
+    print(f"wall time {elapsed:.3f}s, {total_events} events, {total_events / elapsed:.1f} events/sec")
+
+
+def synthetic_events(count):
+    start = datetime.datetime(2025, 1, 1, 9, 0)
+    events = []
+    for i in range(count):
+        title = f"Benchmark Open {i}"
+        link = f"https://www.flograppling.com/events/{i}-benchmark-open"
+        events.append({
+            'title': title,
+            'link': link,
+            'description': f"<p><strong>{title}</strong></p><p>Location: Arena {i % 50}</p>",
+            'pubDate': start + datetime.timedelta(hours=i),
+            'guid': f"{link}#{title}",
+        })
+    return events
+
+
+def bench_feed(sizes):
+    scraper = FloGrapplingEventScraper()
+    print("\ncreate_rss_feed")
+    print(f"{'events':>7} {'seconds':>8} {'events/sec':>11}")
+    for size in sizes:
+        events = synthetic_events(size)
+        started = time.perf_counter()
+        scraper.create_rss_feed(events, output_path=os.path.join(os.getcwd(), "feed.xml"))
+        elapsed = time.perf_counter() - started
+        print(f"{size:>7} {elapsed:>8.3f} {size / elapsed:>11.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--recordings", help="directory written by scraper.py --record")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--feed-sizes", default="100,1000,10000",
+                        help="comma separated event counts for the feed benchmark")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        recordings = os.path.abspath(args.recordings) if args.recordings else workdir
+        if not args.recordings:
+            recordings_from_fixtures(recordings, FloGrapplingEventScraper().facets)
+        # Run from a scratch directory so debug output stays out of the repo
+        os.chdir(workdir)
+        asyncio.run(bench_fetch(recordings, args.concurrency))
+        bench_feed([int(size) for size in args.feed_sizes.split(",")])
+
+
+if __name__ == "__main__":
+    main()
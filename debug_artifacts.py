@@ -0,0 +1,97 @@
+"""Debug screenshots and HTML snapshots of months that went wrong.
+
+Artifacts are off by default. When enabled they are only captured for months
+that yield no events or fail (unless ``mode="always"``), and everything after
+grabbing the bytes from the page (conversion, writing, pruning old files)
+runs in a background thread so it stays off the scraping hot path.
+"""
+import asyncio
+import glob
+import io
+import os
+
+MODES = ("off", "failures", "always")
+IMAGE_FORMATS = ("jpeg", "png", "webp")
+
+
+class DebugArtifacts:
+    def __init__(self, directory="debug", mode="off", image_format="jpeg", quality=60,
+                 html=False, keep=30):
+        if mode not in MODES:
+            raise ValueError(f"Unknown debug artifact mode: {mode}")
+        if image_format not in IMAGE_FORMATS:
+            raise ValueError(f"Unknown debug image format: {image_format}")
+        self.directory = directory
+        self.mode = mode
+        self.image_format = image_format
+        self.quality = quality
+        self.html = html
+        # Maximum number of artifact files kept in ``directory``
+        self.keep = keep
+        self._pending = set()
+
+    def wants(self, events, error=None):
+        if self.mode == "always":
+            return True
+        return self.mode == "failures" and (error is not None or not events)
+
+    async def capture(self, page, date, reason=""):
+        """Grab a screenshot (and optionally the HTML) of ``page`` and save it in the background.
+
+        The page is handed back to the pool right after, so the bytes are
+        taken here; only the slow part is deferred.
+        """
+        if self.mode == "off":
+            return
+        base = os.path.join(self.directory, f"page_{date.replace('-', '_')}")
+        try:
+            if self.image_format == "png":
+                image = await page.screenshot(type="png")
+            else:
+                # Playwright cannot encode WebP; it is converted from JPEG later
+                image = await page.screenshot(type="jpeg", quality=self.quality)
+            html = await page.content() if self.html else None
+        except Exception as e:
+            print(f"Could not capture debug artifacts for {date}: {e}")
+            return
+
+        print(f"Saving debug artifacts for {date}{f' ({reason})' if reason else ''}")
+        task = asyncio.ensure_future(asyncio.to_thread(self._write, base, image, html))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def flush(self):
+        """Wait for background writes to finish."""
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
+    def _write(self, base, image, html):
+        os.makedirs(self.directory, exist_ok=True)
+        extension = {"jpeg": "jpg", "png": "png", "webp": "webp"}[self.image_format]
+        if self.image_format == "webp":
+            image, extension = _to_webp(image, self.quality)
+        with open(f"{base}.{extension}", "wb") as f:
+            f.write(image)
+        if html is not None:
+            with open(f"{base}.html", "w", encoding="utf-8") as f:
+                f.write(html)
+        self._prune()
+
+    def _prune(self):
+        files = sorted(glob.glob(os.path.join(self.directory, "page_*")), key=os.path.getmtime)
+        for path in files[:max(0, len(files) - self.keep)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def _to_webp(jpeg, quality):
+    """Convert JPEG bytes to WebP when Pillow is installed, else keep the JPEG."""
+    try:
+        from PIL import Image
+    except ImportError:
+        return jpeg, "jpg"
+    out = io.BytesIO()
+    Image.open(io.BytesIO(jpeg)).save(out, format="WEBP", quality=quality)
+    return out.getvalue(), "webp"
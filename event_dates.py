@@ -0,0 +1,196 @@
+"""Parse the date and time strings shown on FloGrappling into UTC datetimes.
+
+The events page shows dates as section headers ("Wednesday, March 19",
+"Mar 19 - 21, 2025", "03/19/2025", ...) and times like "8:30 AM CDT". The
+same header is repeated for every event under it, so parsing is memoized.
+Everything is matched with precompiled regexes rather than trying
+``strptime`` formats one by one, and results are timezone-aware UTC.
+
+When a date cannot be parsed the first day of the scraped month is used
+instead of "now", so an event does not drift to a new date on every run.
+"""
+import datetime
+import functools
+import re
+from zoneinfo import ZoneInfo
+
+UTC = datetime.timezone.utc
+
+MONTHS = {
+    name: number
+    for number, names in enumerate([
+        ("jan", "january"), ("feb", "february"), ("mar", "march"), ("apr", "april"),
+        ("may",), ("jun", "june"), ("jul", "july"), ("aug", "august"),
+        ("sep", "sept", "september"), ("oct", "october"), ("nov", "november"), ("dec", "december"),
+    ], start=1)
+    for name in names
+}
+
+# Abbreviations shown after times. Fixed offsets for the explicit standard and
+# daylight variants, DST-aware zones for the generic ones.
+TIMEZONES = {
+    "UTC": UTC,
+    "GMT": UTC,
+    "Z": UTC,
+    "EST": datetime.timezone(datetime.timedelta(hours=-5), "EST"),
+    "EDT": datetime.timezone(datetime.timedelta(hours=-4), "EDT"),
+    "CST": datetime.timezone(datetime.timedelta(hours=-6), "CST"),
+    "CDT": datetime.timezone(datetime.timedelta(hours=-5), "CDT"),
+    "MST": datetime.timezone(datetime.timedelta(hours=-7), "MST"),
+    "MDT": datetime.timezone(datetime.timedelta(hours=-6), "MDT"),
+    "PST": datetime.timezone(datetime.timedelta(hours=-8), "PST"),
+    "PDT": datetime.timezone(datetime.timedelta(hours=-7), "PDT"),
+    "AKST": datetime.timezone(datetime.timedelta(hours=-9), "AKST"),
+    "AKDT": datetime.timezone(datetime.timedelta(hours=-8), "AKDT"),
+    "HST": datetime.timezone(datetime.timedelta(hours=-10), "HST"),
+    "BST": datetime.timezone(datetime.timedelta(hours=1), "BST"),
+    "CET": datetime.timezone(datetime.timedelta(hours=1), "CET"),
+    "CEST": datetime.timezone(datetime.timedelta(hours=2), "CEST"),
+    "ET": ZoneInfo("America/New_York"),
+    "CT": ZoneInfo("America/Chicago"),
+    "MT": ZoneInfo("America/Denver"),
+    "PT": ZoneInfo("America/Los_Angeles"),
+}
+
+# "March 19, 2025", "Wed, Mar 19", "Mar 19 - 21, 2025", "Mar. 19th 2025"
+_MONTH_NAME_DATE = re.compile(
+    r"\b(?P<month>[A-Za-z]{3,9})\.?\s+(?P<day>\d{1,2})(?:st|nd|rd|th)?"
+    r"(?:\s*[-–]\s*(?:[A-Za-z]{3,9}\.?\s+)?\d{1,2}(?:st|nd|rd|th)?)?"
+    r"(?:,?\s+(?P<year>\d{4}))?\b"
+)
+# "2025-03-19" (also the date part of ISO timestamps)
+_ISO_DATE = re.compile(r"\b(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2})(?!\d)")
+# "03/19/2025", "3/19/25"
+_US_DATE = re.compile(r"\b(?P<month>\d{1,2})/(?P<day>\d{1,2})/(?P<year>\d{4}|\d{2})\b")
+# "8:30 AM CDT", "8:30am", "13:30", "8 PM ET", "13:30 UTC"
+_TIME = re.compile(
+    r"\b(?P<hour>\d{1,2})(?::(?P<minute>\d{2}))?\s*(?P<ampm>[AaPp]\.?[Mm]\.?)?"
+    r"(?:\s*(?P<tz>[A-Z]{1,4})\b)?"
+)
+
+
+def _resolve_year(month, day, context):
+    """Pick the year for a date shown without one, near the scraped month."""
+    year = context.year
+    if month - context.month > 6:
+        year -= 1
+    elif context.month - month > 6:
+        year += 1
+    return datetime.date(year, month, day)
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_date(text, context=None):
+    """Parse a date header into a ``datetime.date``, or None.
+
+    ``context`` is the scraped month (``datetime.date``) and supplies the
+    year for headers like "Wednesday, March 19".
+    """
+    if not text:
+        return None
+    try:
+        match = _ISO_DATE.search(text)
+        if match:
+            return datetime.date(int(match["year"]), int(match["month"]), int(match["day"]))
+
+        match = _US_DATE.search(text)
+        if match:
+            year = int(match["year"])
+            if year < 100:
+                year += 2000
+            return datetime.date(year, int(match["month"]), int(match["day"]))
+
+        for match in _MONTH_NAME_DATE.finditer(text):
+            month = MONTHS.get(match["month"].lower())
+            if month is None:
+                continue
+            day = int(match["day"])
+            if match["year"]:
+                return datetime.date(int(match["year"]), month, day)
+            if context is not None:
+                return _resolve_year(month, day, context)
+    except ValueError:
+        return None  # Out of range day or month
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def parse_time(text, default_tz=UTC):
+    """Parse a time of day into ``(datetime.time, tzinfo)``, or None.
+
+    The first time is used. In a range like "8:30 AM - 5:00 PM CDT" the zone
+    is only written after the last time, so it is taken from there.
+    """
+    if not text:
+        return None
+    found = None
+    for match in _TIME.finditer(text):
+        if match["minute"] is None and match["ampm"] is None:
+            continue  # A bare number is not a time
+        hour = int(match["hour"])
+        minute = int(match["minute"] or 0)
+        ampm = (match["ampm"] or "").replace(".", "").upper()
+        if ampm == "PM" and hour < 12:
+            hour += 12
+        elif ampm == "AM" and hour == 12:
+            hour = 0
+        if hour > 23 or minute > 59:
+            continue
+        tz = TIMEZONES.get(match["tz"] or "")
+        if found is None:
+            found = datetime.time(hour, minute)
+        if tz is not None:
+            return found, tz
+    if found is None:
+        return None
+    return found, default_tz
+
+
+def event_day(date_text, month=None):
+    """The event's calendar date where it takes place, as ``(date, date_known)``.
+
+    Falls back to the first day of ``month`` (or today) like
+    ``parse_event_datetime``. Unlike the date of the UTC datetime, this does
+    not move with the time of day, so it is what identifies an event.
+    """
+    if isinstance(month, str):
+        month = datetime.date.fromisoformat(month)
+    date = parse_date(date_text.strip(), month) if date_text else None
+    if date is None:
+        return month or datetime.datetime.now(UTC).date(), False
+    return date, True
+
+
+def parse_event_datetime(date_text, time_text="", month=None, default_tz=UTC):
+    """Combine a date header and a time into an aware UTC datetime.
+
+    ``month`` is the scraped month, as a ``datetime.date`` or ``YYYY-MM-DD``
+    string. It supplies missing years, and its first day is used when the
+    date cannot be parsed at all. Returns ``(datetime, date_known)``.
+    """
+    date, date_known = event_day(date_text, month)
+    parsed_time = parse_time(time_text.strip(), default_tz) if time_text else None
+    if parsed_time is None:
+        local = datetime.datetime.combine(date, datetime.time(0, 0), default_tz)
+    else:
+        time_of_day, tz = parsed_time
+        local = datetime.datetime.combine(date, time_of_day, tz)
+    return local.astimezone(UTC), date_known
+
+
+def parse_month(pairs, month, default_tz=UTC):
+    """Batch version of ``parse_event_datetime`` for one scraped month.
+
+    ``pairs`` is an iterable of ``(date_text, time_text)``; returns a list of
+    ``(datetime, date_known)`` in the same order.
+    """
+    if isinstance(month, str):
+        month = datetime.date.fromisoformat(month)
+    return [parse_event_datetime(date_text, time_text, month, default_tz) for date_text, time_text in pairs]
+
+
+def ensure_utc(value):
+    """Treat naive datetimes (from older caches and stores) as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
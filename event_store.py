@@ -0,0 +1,234 @@
+"""Persistent SQLite store of every event the scraper has seen.
+
+Events are deduplicated on a normalized title plus the event's local date
+(``eventDate``, not the date of the UTC ``pubDate``, which moves with the
+time of day), which also gives each event a stable ID that survives changes
+to its link or to the exact title text. An event first seen without a usable
+date is filed under the first of its month and keeps that ID once its real
+date shows up; a later sighting without a date does not undo a known one.
+Every upsert updates ``last_seen`` and keeps the original ``first_seen``;
+``changed_at`` moves only when the event's title, location, link,
+description or date actually changed, which drives the feed of new and
+updated events. The feed and index page are generated from the store rather
+than from one run's raw results.
+"""
+import datetime
+import hashlib
+import os
+import re
+import sqlite3
+import unicodedata
+
+from event_dates import ensure_utc
+from month_cache import facets_hash
+
+GUID_PREFIX = "urn:flo-event-rss:event:"
+
+_NON_WORD = re.compile(r"[^\w]+")
+
+
+def normalize(text):
+    """Lowercase, strip accents and punctuation, and collapse whitespace."""
+    text = unicodedata.normalize("NFKD", text or "")
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return _NON_WORD.sub(" ", text.lower()).strip()
+
+
+def event_id(title, event_date):
+    """Stable ID for an event: hash of its normalized title and date."""
+    key = f"{normalize(title)}|{event_date.isoformat()}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+class EventStore:
+    def __init__(self, path="cache/events.sqlite3"):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.executescript("""
+            CREATE TABLE IF NOT EXISTS events (
+                id TEXT PRIMARY KEY,
+                norm_title TEXT NOT NULL,
+                event_date TEXT NOT NULL,
+                norm_location TEXT NOT NULL,
+                title TEXT NOT NULL,
+                location TEXT NOT NULL,
+                link TEXT NOT NULL,
+                description TEXT NOT NULL,
+                pub_date TEXT NOT NULL,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL,
+                changed_at TEXT,
+                date_known INTEGER NOT NULL DEFAULT 1
+            );
+            CREATE INDEX IF NOT EXISTS events_norm_title ON events (norm_title);
+            CREATE INDEX IF NOT EXISTS events_event_date ON events (event_date);
+            CREATE INDEX IF NOT EXISTS events_norm_location ON events (norm_location);
+            CREATE TABLE IF NOT EXISTS event_queries (
+                event_id TEXT NOT NULL,
+                facets_hash TEXT NOT NULL,
+                PRIMARY KEY (facets_hash, event_id)
+            );
+        """)
+        columns = [row[1] for row in self.db.execute("PRAGMA table_info(events)")]
+        if "changed_at" not in columns:
+            # Stores created before changes were tracked
+            self.db.execute("ALTER TABLE events ADD COLUMN changed_at TEXT")
+            self.db.execute("UPDATE events SET changed_at = first_seen")
+        if "date_known" not in columns:
+            self.db.execute("ALTER TABLE events ADD COLUMN date_known INTEGER NOT NULL DEFAULT 1")
+        self.db.execute("CREATE INDEX IF NOT EXISTS events_changed_at ON events (changed_at)")
+        self.db.commit()
+
+    def upsert(self, events, seen_at=None, facets=None):
+        """Insert new events and refresh known ones. Returns the number of new events.
+
+        With ``facets``, the events are also recorded as results of that
+        facet query, so feeds can select them with ``events(facets=...)``.
+        """
+        seen_at = (seen_at or datetime.datetime.now()).isoformat()
+        before = self.count()
+        rows = []
+        seen_ids = []
+        for event in events:
+            pub_date = event['pubDate']
+            location = event.get('location', '')
+            # Events from older caches have no eventDate
+            day = datetime.date.fromisoformat(event['eventDate']) if event.get('eventDate') else pub_date.date()
+            date_known = event.get('dateKnown', True)
+            id_, keep_stored = self._resolve_id(event['title'], day, date_known)
+            if keep_stored:
+                seen_ids.append(id_)
+                continue
+            rows.append((
+                id_,
+                normalize(event['title']),
+                day.isoformat(),
+                normalize(location),
+                event['title'],
+                location,
+                event['link'],
+                event['description'],
+                pub_date.isoformat(),
+                seen_at,
+                seen_at,
+                seen_at,
+                int(date_known),
+            ))
+        self.db.executemany("""
+            INSERT INTO events (id, norm_title, event_date, norm_location, title, location, link,
+                                description, pub_date, first_seen, last_seen, changed_at, date_known)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (id) DO UPDATE SET
+                changed_at = CASE WHEN events.title IS NOT excluded.title
+                                    OR events.location IS NOT excluded.location
+                                    OR events.link IS NOT excluded.link
+                                    OR events.description IS NOT excluded.description
+                                    OR events.pub_date IS NOT excluded.pub_date
+                             THEN excluded.changed_at ELSE events.changed_at END,
+                norm_location = excluded.norm_location,
+                title = excluded.title,
+                location = excluded.location,
+                link = excluded.link,
+                description = excluded.description,
+                pub_date = excluded.pub_date,
+                event_date = excluded.event_date,
+                date_known = excluded.date_known,
+                last_seen = excluded.last_seen
+        """, rows)
+        self.db.executemany("UPDATE events SET last_seen = ? WHERE id = ?", [(seen_at, id_) for id_ in seen_ids])
+        if facets is not None:
+            query_hash = facets_hash(facets)
+            self.db.executemany(
+                "INSERT OR IGNORE INTO event_queries (event_id, facets_hash) VALUES (?, ?)",
+                [(row[0], query_hash) for row in rows] + [(id_, query_hash) for id_ in seen_ids],
+            )
+        self.db.commit()
+        return self.count() - before
+
+    def _resolve_id(self, title, day, date_known):
+        """ID to store an event under, and whether the stored row should be
+        left as it is because it has a date and this sighting does not."""
+        norm_title = normalize(title)
+        row = self.db.execute(
+            "SELECT id, date_known FROM events WHERE norm_title = ? AND event_date = ?",
+            (norm_title, day.isoformat()),
+        ).fetchone()
+        if row is not None:
+            return row[0], bool(row[1]) and not date_known
+        # The same title elsewhere in the month: a dateless sighting of a
+        # known event, or the real date of an event first seen without one
+        row = self.db.execute(
+            "SELECT id FROM events WHERE norm_title = ? AND substr(event_date, 1, 7) = ? AND date_known = ? "
+            "ORDER BY event_date LIMIT 1",
+            (norm_title, day.isoformat()[:7], int(not date_known)),
+        ).fetchone()
+        if row is None:
+            return event_id(title, day), False
+        return row[0], not date_known
+
+    def count(self):
+        return self.db.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+    def get(self, title, event_date):
+        """Look an event up by title and date (``datetime.date``)."""
+        row = self.db.execute(
+            "SELECT * FROM events WHERE norm_title = ? AND event_date = ?", (normalize(title), event_date.isoformat())
+        ).fetchone()
+        return self._to_event(row) if row else None
+
+    def _facets_clause(self, facets, clauses, params):
+        hashes = [facets_hash(query_facets) for query_facets in facets]
+        clauses.append(
+            "id IN (SELECT event_id FROM event_queries WHERE facets_hash IN (%s))"
+            % ", ".join("?" * len(hashes))
+        )
+        params.extend(hashes)
+
+    def events(self, start=None, end=None, facets=None):
+        """Stored events ordered by date, optionally limited to ``start <= date <= end``
+        and to events returned by any of the facet queries in ``facets``."""
+        query = "SELECT * FROM events"
+        clauses, params = [], []
+        if facets is not None:
+            self._facets_clause(facets, clauses, params)
+        if start is not None:
+            clauses.append("event_date >= ?")
+            params.append(start.isoformat())
+        if end is not None:
+            clauses.append("event_date <= ?")
+            params.append(end.isoformat())
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY pub_date, id"
+        return [self._to_event(row) for row in self.db.execute(query, params)]
+
+    def changes(self, since, facets=None, limit=50):
+        """Events that were added or changed at or after ``since``, latest first."""
+        query = "SELECT * FROM events"
+        clauses, params = ["changed_at >= ?"], [since.isoformat()]
+        if facets is not None:
+            self._facets_clause(facets, clauses, params)
+        query += " WHERE " + " AND ".join(clauses) + " ORDER BY changed_at DESC, id LIMIT ?"
+        params.append(limit)
+        return [self._to_event(row) for row in self.db.execute(query, params)]
+
+    def _to_event(self, row):
+        (id_, _norm_title, _event_date, _norm_location, title, location, link, description,
+         pub_date, first_seen, last_seen, changed_at, _date_known) = row
+        return {
+            'id': id_,
+            'title': title,
+            'location': location,
+            'link': link,
+            'description': description,
+            'pubDate': ensure_utc(datetime.datetime.fromisoformat(pub_date)),
+            'guid': GUID_PREFIX + id_,
+            'first_seen': datetime.datetime.fromisoformat(first_seen),
+            'last_seen': datetime.datetime.fromisoformat(last_seen),
+            'changed_at': datetime.datetime.fromisoformat(changed_at or first_seen),
+        }
+
+    def close(self):
+        self.db.close()
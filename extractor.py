@@ -0,0 +1,372 @@
+"""DOM extraction scripts that pull raw events out of a rendered events page.
+
+Extractors are versioned so a new script can be rolled out (and benchmarked,
+see ``benchmarks/bench_extractor.py``) next to the one it replaces. Each one
+is installed once per browser context with ``add_init_script`` as a global
+function, so a month only sends a tiny call expression to the page instead of
+the whole script. Whatever the payload shape, ``Extractor.run`` returns the
+raw event dicts (``title``, ``location``, ``time``, ``dateText``, ``link``)
+that ``FloGrapplingEventScraper.build_event`` expects.
+"""
+
+# v1: the original extraction script. Scans the whole document several times
+# and returns a list of event objects. Tries directly getting March 19, 2025
+# event data from the page content, using the page's intrinsic structure to
+# find the event.
+LEGACY_SOURCE = r"""
+    () => {
+        const events = [];
+
+        // Look for table rows that might contain events
+        const rows = Array.from(document.querySelectorAll('tr'));
+        for (const row of rows) {
+            const rowText = row.textContent.trim();
+
+            // Skip header rows or empty rows
+            if (!rowText || rowText.includes('EVENT') && rowText.includes('LOCATION') && rowText.includes('TIME')) {
+                continue;
+            }
+
+            // Try to extract cells or structured content
+            const cells = Array.from(row.querySelectorAll('td'));
+            if (cells.length >= 3) {
+                const timeCell = cells[0]?.textContent.trim();
+                const eventCell = cells[1]?.textContent.trim(); 
+                const locationCell = cells[2]?.textContent.trim();
+
+                if (eventCell && eventCell.length > 3) {
+                    events.push({
+                        title: eventCell,
+                        location: locationCell || '',
+                        time: timeCell || '',
+                        dateText: '', // Will be populated from the page sections
+                        link: row.querySelector('a')?.href || window.location.href
+                    });
+                }
+            }
+        }
+
+        // If we couldn't find table rows, look for dated sections with events
+        if (events.length === 0) {
+            // Look for date headers
+            const dateHeaders = Array.from(document.querySelectorAll('h2, h3, h4, [class*="date"], [class*="header"]'));
+            for (const header of dateHeaders) {
+                const headerText = header.textContent.trim();
+                if (!headerText) continue;
+
+                // Check if it looks like a date (contains digits and possibly month names)
+                const hasDatePattern = /\d+/.test(headerText) && 
+                                     (/jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec/i.test(headerText) ||
+                                      /january|february|march|april|may|june|july|august|september|october|november|december/i.test(headerText));
+
+                if (hasDatePattern) {
+                    // Look for event elements near this date header
+                    let eventElements = [];
+
+                    // Check following siblings until we hit another date header
+                    let element = header.nextElementSibling;
+                    while (element) {
+                        // Stop if we hit another date header
+                        if (element.tagName && /^H[1-6]$/.test(element.tagName) || 
+                            element.className && element.className.includes('date')) {
+                            break;
+                        }
+
+                        // Check if this element contains event info
+                        const elementText = element.textContent.trim();
+                        if (elementText && elementText.length > 5) {
+                            eventElements.push(element);
+                        }
+
+                        element = element.nextElementSibling;
+                    }
+
+                    // Process found event elements
+                    for (const eventEl of eventElements) {
+                        // Look for structured content or just use text
+                        const title = eventEl.querySelector('[class*="title"]')?.textContent.trim() || 
+                                    eventEl.textContent.trim();
+
+                        const location = eventEl.querySelector('[class*="location"]')?.textContent.trim() || '';
+                        const time = eventEl.querySelector('[class*="time"]')?.textContent.trim() || '';
+
+                        if (title && title.length > 3) {
+                            events.push({
+                                title: title,
+                                location: location,
+                                time: time,
+                                dateText: headerText,
+                                link: eventEl.querySelector('a')?.href || window.location.href
+                            });
+                        }
+                    }
+                }
+            }
+        }
+
+        // Specific search for the Pan Jiu Jitsu event
+        const bodyText = document.body.textContent;
+        if (bodyText.includes('Pan Jiu Jitsu IBJJF Championship')) {
+            console.log('Found Pan Jiu Jitsu IBJJF Championship in body text');
+
+            // Try to find the event in context
+            const allElements = Array.from(document.querySelectorAll('*'));
+            for (const el of allElements) {
+                if (el.textContent.includes('Pan Jiu Jitsu IBJJF Championship')) {
+                    // Found element containing the text, now find its context
+                    const row = el.closest('tr') || el.closest('[class*="event"]') || el.closest('[class*="row"]');
+
+                    if (row) {
+                        const locationEl = row.querySelector('[class*="location"]') || 
+                                        Array.from(row.querySelectorAll('*')).find(e => e.textContent.includes('Arena') || e.textContent.includes('Kissimmee'));
+
+                        const timeEl = row.querySelector('[class*="time"]') || 
+                                    Array.from(row.querySelectorAll('*')).find(e => e.textContent.includes('AM') || e.textContent.includes('PM'));
+
+                        // Add if not already found
+                        const isDuplicate = events.some(e => e.title.includes('Pan Jiu Jitsu IBJJF Championship'));
+                        if (!isDuplicate) {
+                            events.push({
+                                title: 'Pan Jiu Jitsu IBJJF Championship',
+                                location: locationEl ? locationEl.textContent.trim() : 'Silver Spurs Arena - Kissimmee, FL',
+                                time: timeEl ? timeEl.textContent.trim() : '8:30 AM CDT',
+                                dateText: 'March 19, 2025',
+                                link: window.location.href
+                            });
+                        }
+                    }
+                }
+            }
+        }
+
+        // As a last resort, specifically check for March 2025
+        if (bodyText.includes('March 19') || bodyText.includes('Mar 19') || bodyText.includes('03/19/2025')) {
+            if (!events.some(e => e.dateText.includes('March 19') || e.dateText.includes('Mar 19'))) {
+                // Scan for potential event elements
+                const potentialEvents = [];
+                const allElements = Array.from(document.querySelectorAll('*'));
+
+                for (const el of allElements) {
+                    // Skip very common elements that are unlikely to be event containers
+                    if (['SCRIPT', 'STYLE', 'META', 'LINK', 'HTML', 'HEAD', 'BODY'].includes(el.tagName)) {
+                        continue;
+                    }
+
+                    const text = el.textContent.trim();
+                    if (text.length > 10 && text.length < 200) {  // Reasonable text length for an event
+                        // Check for event-like patterns (title-like content)
+                        if (/Championship|Tournament|Open|Grand Prix|Cup|Challenge|Masters|Nationals|Worlds/i.test(text)) {
+                            potentialEvents.push({
+                                element: el,
+                                text: text
+                            });
+                        }
+                    }
+                }
+
+                // Process potential events
+                for (const {element, text} of potentialEvents) {
+                    // Skip if we already have this event
+                    if (events.some(e => e.title === text)) {
+                        continue;
+                    }
+
+                    // Look for date indicators
+                    const hasDateIndicator = /March 19|Mar 19|03\/19\/2025|3\/19\/2025/i.test(
+                        element.textContent || 
+                        (element.previousElementSibling?.textContent || '') || 
+                        (element.parentElement?.textContent || '')
+                    );
+
+                    if (hasDateIndicator) {
+                        events.push({
+                            title: text,
+                            location: '', // May not be available
+                            time: '',     // May not be available
+                            dateText: 'March 19, 2025',
+                            link: window.location.href
+                        });
+                    }
+                }
+            }
+        }
+
+        return events;
+    }
+"""
+
+# v2: one TreeWalker pass over the body that collects table rows, date headers
+# and the text nodes v1 searches for, and only reads ``textContent`` for those
+# candidates. Returns compact rows: [title, location, time, dateText, link],
+# with ``link`` null when it is just the page URL. It finds the same rows as
+# v1 (checked by ``benchmarks/bench_extractor.py``), except that "March 19"
+# only triggers the last-resort scan when it appears within one text node
+# outside <script> and <style>, where v1 searched all of ``body.textContent``.
+SINGLE_PASS_SOURCE = r"""
+    () => {
+        const PAN = 'Pan Jiu Jitsu IBJJF Championship';
+        const KEYWORDS = /Championship|Tournament|Open|Grand Prix|Cup|Challenge|Masters|Nationals|Worlds/i;
+        const MONTHS = /jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec/i;
+        const MARCH_19 = /March 19|Mar 19|03\/19\/2025|3\/19\/2025/i;
+        const TIME = /\d{1,2}:\d{2}\s*[AP]M(\s+[A-Z]{2,4})?/i;
+        const SKIP = new Set(['SCRIPT', 'STYLE', 'NOSCRIPT', 'TEMPLATE', 'SVG', 'svg', 'HEAD']);
+        const HEADER_TAGS = new Set(['H2', 'H3', 'H4']);
+        const LAST_RESORT_SKIP = new Set(['SCRIPT', 'STYLE', 'META', 'LINK', 'HTML', 'HEAD', 'BODY']);
+        // What makes v1 try its last resort (case-sensitive, anywhere in the body)
+        const MARCH_19_PAGE = /March 19|Mar 19|03\/19\/2025/;
+
+        const events = [];
+        const rows = [];
+        const headers = [];
+        let panElement = null;
+        let sawMarch19 = false;
+
+        const className = (el) => (el.getAttribute && el.getAttribute('class')) || '';
+        const text = (el) => (el ? el.textContent.trim() : '');
+        const linkOf = (el) => {
+            const a = el.tagName === 'A' ? el : el.querySelector('a');
+            return a && a.href && a.href !== location.href ? a.href : null;
+        };
+
+        const walker = document.createTreeWalker(
+            document.body,
+            NodeFilter.SHOW_ELEMENT | NodeFilter.SHOW_TEXT,
+            {acceptNode: (node) => node.nodeType === 1 && SKIP.has(node.tagName)
+                ? NodeFilter.FILTER_REJECT : NodeFilter.FILTER_ACCEPT}
+        );
+        for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+            if (node.nodeType === 3) {
+                const data = node.data;
+                if (data.length < 4) continue;
+                if (!panElement && data.includes(PAN)) panElement = node.parentElement;
+                if (!sawMarch19 && MARCH_19_PAGE.test(data)) sawMarch19 = true;
+                continue;
+            }
+            if (node.tagName === 'TR') {
+                rows.push(node);
+            } else if (HEADER_TAGS.has(node.tagName) || /date|header/.test(className(node))) {
+                headers.push(node);
+            }
+        }
+
+        // Table rows: time, event, location cells
+        for (const row of rows) {
+            const cells = row.cells;
+            if (!cells || cells.length < 3) continue;
+            const title = text(cells[1]);
+            if (title.length <= 3) continue;
+            const rowText = row.textContent;
+            if (rowText.includes('EVENT') && rowText.includes('LOCATION') && rowText.includes('TIME')) continue;
+            events.push([title, text(cells[2]), text(cells[0]), '', linkOf(row)]);
+        }
+
+        // Dated sections: a date header followed by sibling event elements
+        if (events.length === 0) {
+            for (const header of headers) {
+                const headerText = text(header);
+                if (!headerText || !/\d/.test(headerText) || !MONTHS.test(headerText)) continue;
+                for (let el = header.nextElementSibling; el; el = el.nextElementSibling) {
+                    if (/^H[1-6]$/.test(el.tagName) || className(el).includes('date')) break;
+                    const elText = text(el);
+                    if (elText.length <= 5) continue;
+                    const title = text(el.querySelector('[class*="title"]')) || elText;
+                    if (title.length <= 3) continue;
+                    events.push([
+                        title,
+                        text(el.querySelector('[class*="location"]')),
+                        text(el.querySelector('[class*="time"]')),
+                        headerText,
+                        linkOf(el),
+                    ]);
+                }
+            }
+        }
+
+        // Specific search for the Pan Jiu Jitsu event
+        if (panElement && !events.some((e) => e[0].includes(PAN))) {
+            const row = panElement.closest('tr') || panElement.closest('[class*="event"]') || panElement.closest('[class*="row"]');
+            if (row) {
+                const rowText = row.textContent;
+                const timeMatch = text(row.querySelector('[class*="time"]')) || (rowText.match(TIME) || [''])[0];
+                events.push([
+                    PAN,
+                    text(row.querySelector('[class*="location"]')) || 'Silver Spurs Arena - Kissimmee, FL',
+                    timeMatch || '8:30 AM CDT',
+                    'March 19, 2025',
+                    null,
+                ]);
+            }
+        }
+
+        // As a last resort, look for March 19, 2025 events by keyword. This
+        // rarely runs, so it scans every element like v1 does: the keyword
+        // and the date are often in sibling elements under one container
+        if (sawMarch19 && !events.some((e) => /March 19|Mar 19/.test(e[3]))) {
+            for (const el of document.querySelectorAll('*')) {
+                if (LAST_RESORT_SKIP.has(el.tagName)) continue;
+                const elText = text(el);
+                if (elText.length <= 10 || elText.length >= 200) continue;
+                if (!KEYWORDS.test(elText) || !MARCH_19.test(elText)) continue;
+                if (events.some((e) => e[0] === elText)) continue;
+                events.push([elText, '', '', 'March 19, 2025', null]);
+            }
+        }
+
+        return events;
+    }
+"""
+
+
+class Extractor:
+    """A versioned DOM extraction script.
+
+    ``source`` is a JavaScript function expression. When ``compact`` is true
+    it returns rows of ``[title, location, time, dateText, link]`` instead of
+    objects.
+    """
+
+    def __init__(self, version, source, compact=False):
+        self.version = version
+        self.source = source.strip()
+        self.compact = compact
+        self.global_name = f"__floExtractEvents_{version}"
+
+    @property
+    def init_script(self):
+        """Script for ``add_init_script`` that defines the extractor on ``window``."""
+        return f"window.{self.global_name} = {self.source};"
+
+    async def run(self, page):
+        """Extract raw events from ``page``.
+
+        Uses the function installed by ``init_script`` when it is there and
+        falls back to sending the full source otherwise.
+        """
+        payload = await page.evaluate(
+            f"() => window.{self.global_name} ? window.{self.global_name}() : null"
+        )
+        if payload is None:
+            payload = await page.evaluate(self.source)
+        return self.decode(payload)
+
+    def decode(self, payload):
+        if not self.compact:
+            return payload
+        return [
+            {
+                "title": title or "",
+                "location": location or "",
+                "time": time_text or "",
+                "dateText": date_text or "",
+                "link": link or "",
+            }
+            for title, location, time_text, date_text, link in payload
+        ]
+
+
+EXTRACTORS = {
+    "v1": Extractor("v1", LEGACY_SOURCE),
+    "v2": Extractor("v2", SINGLE_PASS_SOURCE, compact=True),
+}
+
+DEFAULT_EXTRACTOR = "v2"
@@ -0,0 +1,82 @@
+"""Split a feed's events into the main feed and its archive shards.
+
+The main (subscription) feed holds at most ``max_items`` events from the
+scrape window, upcoming events first (soonest first), then past ones (most
+recent first), so it stays small however wide the window or the facet set.
+Everything else is sharded by year or month into archive feeds that are
+chained to the main feed with RFC 5005 links (``prev-archive``,
+``next-archive``, ``current``), keeping the full history available.
+Published archives are meant to be stable, so their items can be read back
+(``read_archive``) and kept when the event store no longer has them.
+"""
+import datetime
+import email.utils
+import xml.etree.ElementTree as ElementTree
+
+SHARD_FORMATS = {"year": "%Y", "month": "%Y-%m"}
+
+
+def upcoming_first(events, now=None):
+    """Upcoming events soonest first, followed by past events latest first."""
+    now = now or datetime.datetime.now(datetime.timezone.utc)
+    upcoming = sorted((event for event in events if event['pubDate'] >= now), key=lambda event: event['pubDate'])
+    past = sorted((event for event in events if event['pubDate'] < now), key=lambda event: event['pubDate'],
+                  reverse=True)
+    return upcoming + past
+
+
+def split_window(events, window_start, max_items, now=None):
+    """Return ``(current, older)``: the main feed's events and the rest.
+
+    ``window_start`` is a ``datetime.date``; events before it never make the
+    main feed. ``max_items`` of 0 means no cap.
+    """
+    in_window = [event for event in events if event['pubDate'].date() >= window_start]
+    current = upcoming_first(in_window, now)
+    if max_items:
+        current = current[:max_items]
+    kept = {id(event) for event in current}
+    older = [event for event in events if id(event) not in kept]
+    return current, older
+
+
+def shard(events, by="year"):
+    """Group events into archive shards, oldest shard first, events by date."""
+    shards = {}
+    for event in sorted(events, key=lambda event: event['pubDate']):
+        shards.setdefault(event['pubDate'].strftime(SHARD_FORMATS[by]), []).append(event)
+    return dict(sorted(shards.items()))
+
+
+def archive_links(shard_names, index, current_url, url_of):
+    """RFC 5005 links for archive shard ``index`` of ``shard_names``."""
+    links = [("current", current_url), ("self", url_of(shard_names[index]))]
+    if index > 0:
+        links.append(("prev-archive", url_of(shard_names[index - 1])))
+    if index + 1 < len(shard_names):
+        links.append(("next-archive", url_of(shard_names[index + 1])))
+    return links
+
+
+def read_archive(path):
+    """The items of a published feed as events (``title``, ``link``,
+    ``description``, ``guid``, ``pubDate``); empty if it cannot be read."""
+    try:
+        root = ElementTree.parse(path).getroot()
+    except (OSError, ElementTree.ParseError) as e:
+        print(f"Could not read archive feed {path}: {e}")
+        return []
+    events = []
+    for item in root.iter("item"):
+        try:
+            pub_date = email.utils.parsedate_to_datetime(item.findtext("pubDate", ""))
+        except (TypeError, ValueError):
+            continue
+        events.append({
+            'title': item.findtext("title", ""),
+            'link': item.findtext("link", ""),
+            'description': item.findtext("description", ""),
+            'guid': item.findtext("guid", ""),
+            'pubDate': pub_date.astimezone(datetime.timezone.utc),
+        })
+    return events
@@ -0,0 +1,127 @@
+"""Streaming RSS 2.0 writer.
+
+Items are written to a temporary file as they arrive instead of building the
+whole document in memory. The file is swapped in with an atomic rename, and
+only when its content actually changed: a hash of everything except
+``lastBuildDate`` is stored in a trailing comment and compared with the one in
+the existing feed, so an unchanged feed keeps its bytes and mtime.
+
+Feeds can carry Atom links and the RFC 5005 ``<fh:archive/>`` marker, so a
+subscription feed and its archive documents can point at each other.
+"""
+import datetime
+import email.utils
+import hashlib
+import os
+import tempfile
+from xml.sax.saxutils import escape, quoteattr
+
+HASH_MARKER = "<!-- content-sha256: "
+GENERATOR = "flo-event-rss"
+NAMESPACES = (
+    ' xmlns:atom="http://www.w3.org/2005/Atom"'
+    ' xmlns:fh="http://purl.org/syndication/history/1.0"'
+)
+
+
+def format_date(value):
+    """RFC 822 date; naive datetimes are taken to be UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return email.utils.format_datetime(value.astimezone(datetime.timezone.utc), usegmt=True)
+
+
+def _element(name, value):
+    return f"<{name}>{escape(str(value))}</{name}>"
+
+
+def stored_content_hash(path):
+    """Content hash recorded at the end of an existing feed, if any."""
+    try:
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - 256))
+            tail = f.read().decode("utf-8", "replace")
+    except OSError:
+        return None
+    start = tail.rfind(HASH_MARKER)
+    if start == -1:
+        return None
+    return tail[start + len(HASH_MARKER):].split(" ", 1)[0]
+
+
+class StreamingFeedWriter:
+    """Write an RSS feed item by item.
+
+    Use as a context manager, call ``add_item`` for each item, and check
+    ``changed`` afterwards to know whether the file on disk was replaced.
+    """
+
+    def __init__(self, output_path, title, link, description, build_date=None, links=(), archive=False):
+        self.output_path = output_path
+        self.channel = {"title": title, "link": link, "description": description}
+        # (rel, href) pairs written as <atom:link>, e.g. RFC 5005 paging links
+        self.links = list(links)
+        # Mark the document as an RFC 5005 archive document
+        self.archive = archive
+        self.build_date = build_date or datetime.datetime.now(datetime.timezone.utc)
+        self.item_count = 0
+        self.changed = False
+        self._hash = hashlib.sha256()
+        self._file = None
+
+    def __enter__(self):
+        directory = os.path.dirname(self.output_path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, self._temp_path = tempfile.mkstemp(prefix=".feed-", suffix=".xml", dir=directory)
+        self._file = os.fdopen(fd, "w", encoding="utf-8", newline="\n")
+        namespaces = NAMESPACES if self.links or self.archive else ""
+        self._file.write(f'<?xml version="1.0" encoding="utf-8"?>\n<rss version="2.0"{namespaces}><channel>')
+        self._write(
+            _element("title", self.channel["title"])
+            + _element("link", self.channel["link"])
+            + _element("description", self.channel["description"])
+            + "".join(
+                f"<atom:link rel={quoteattr(rel)} href={quoteattr(href)}/>"
+                for rel, href in self.links
+            )
+            + ("<fh:archive/>" if self.archive else "")
+        )
+        # Not hashed, so a new build date alone does not count as a change
+        self._file.write(_element("lastBuildDate", format_date(self.build_date)))
+        self._write(_element("generator", GENERATOR))
+        return self
+
+    def _write(self, text):
+        self._file.write(text)
+        self._hash.update(text.encode("utf-8"))
+
+    def add_item(self, title, link, description, guid, pub_date, guid_is_permalink=True):
+        self._write(
+            "<item>"
+            + _element("title", title)
+            + _element("link", link)
+            + _element("description", description)
+            + f'<guid isPermaLink="{"true" if guid_is_permalink else "false"}">{escape(guid)}</guid>'
+            + _element("pubDate", format_date(pub_date))
+            + "</item>"
+        )
+        self.item_count += 1
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self._write("</channel></rss>\n")
+                content_hash = self._hash.hexdigest()
+                self._file.write(f"{HASH_MARKER}{content_hash} -->\n")
+                self._file.close()
+                if stored_content_hash(self.output_path) != content_hash:
+                    os.chmod(self._temp_path, 0o644)
+                    os.replace(self._temp_path, self.output_path)
+                    self.changed = True
+        finally:
+            if not self._file.closed:
+                self._file.close()
+            if os.path.exists(self._temp_path):
+                os.remove(self._temp_path)
+        return False
@@ -0,0 +1,109 @@
+"""Feed definitions: which facet queries end up in which RSS file.
+
+Feeds are read from ``feeds.json``. Each entry either has its own
+``facets`` query or ``include``s other feeds by slug to form a combined
+feed, e.g.::
+
+    [
+      {"slug": "flograppling_events", "title": "FloGrappling BJJ Events",
+       "description": "...", "facets": {"Event Type": "Brazilian Jiu-Jitsu"}},
+      {"slug": "nogi_events", "title": "FloGrappling No-Gi Events",
+       "description": "...", "facets": {"Event Type": "No-Gi"}},
+      {"slug": "all_events", "title": "All FloGrappling Events",
+       "description": "...", "include": ["flograppling_events", "nogi_events"]}
+    ]
+
+The first feed is the main one: its page is ``docs/index.html``. Each feed
+also gets a JSON Feed and monthly archive pages (see ``site_pages.py``).
+"""
+import json
+import os
+
+from month_cache import facets_hash
+
+DEFAULT_FEEDS = [
+    {
+        "slug": "flograppling_events",
+        "title": "FloGrappling BJJ Events",
+        "description": "Upcoming and past BJJ events from FloGrappling",
+        "facets": {"Streaming Source": "FloSports", "Event Type": "Brazilian Jiu-Jitsu"},
+    },
+]
+
+
+class Feed:
+    def __init__(self, slug, title, description, queries):
+        self.slug = slug
+        self.title = title
+        self.description = description
+        # Facet queries whose events make up this feed
+        self.queries = queries
+
+    @property
+    def filename(self):
+        return f"{self.slug}.xml"
+
+    def page_filename(self, main=False):
+        return "index.html" if main else f"{self.slug}.html"
+
+    @property
+    def changes_filename(self):
+        """Feed of recently added and changed events."""
+        return f"{self.slug}-changes.xml"
+
+    def feed_archive_filename(self, shard):
+        """RSS archive holding the events of ``shard`` (a year or ``YYYY-MM``)."""
+        return f"{self.slug}-archive-{shard}.xml"
+
+    @property
+    def json_filename(self):
+        return f"{self.slug}.json"
+
+    def archive_filename(self, month, page=1):
+        """Archive page for ``month`` (``YYYY-MM``)."""
+        return f"{self.slug}-{month}.html" if page == 1 else f"{self.slug}-{month}-{page}.html"
+
+
+def load_feeds(path="feeds.json"):
+    """Read feed definitions, resolving ``include`` into facet queries."""
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            definitions = json.load(f)
+    else:
+        definitions = DEFAULT_FEEDS
+
+    by_slug = {definition["slug"]: definition for definition in definitions}
+
+    def queries(definition, seen=()):
+        if definition["slug"] in seen:
+            raise ValueError(f"Feed {definition['slug']} includes itself")
+        if "facets" in definition:
+            return [definition["facets"]]
+        found = []
+        for slug in definition.get("include", []):
+            if slug not in by_slug:
+                raise ValueError(f"Feed {definition['slug']} includes unknown feed {slug}")
+            found.extend(queries(by_slug[slug], seen + (definition["slug"],)))
+        return unique_queries_of(found)
+
+    return [
+        Feed(definition["slug"], definition["title"], definition.get("description", ""), queries(definition))
+        for definition in definitions
+    ]
+
+
+def unique_queries_of(facet_queries):
+    """Drop repeated facet queries, keeping the first occurrence."""
+    seen = set()
+    unique = []
+    for facets in facet_queries:
+        key = facets_hash(facets)
+        if key not in seen:
+            seen.add(key)
+            unique.append(facets)
+    return unique
+
+
+def unique_queries(feeds):
+    """Every distinct facet query needed to build ``feeds``."""
+    return unique_queries_of(facets for feed in feeds for facets in feed.queries)
@@ -0,0 +1,177 @@
+"""Browser-free scraping of a month: fetch the events page over HTTP and parse it.
+
+Server-rendered pages often carry their data in a hydration blob such as
+``<script id="__NEXT_DATA__" type="application/json">``. Those blobs are read
+first, with the same heuristics as the captured API responses; otherwise the
+HTML is parsed with BeautifulSoup using the same rules as the DOM extraction
+script. Either way the result is the raw event dicts (``title``, ``location``,
+``time``, ``dateText``, ``link``) that ``build_events`` expects. A page that
+is only rendered client side yields no events, and the scraper then falls back
+to the browser.
+"""
+import datetime
+import importlib.util
+import json
+import re
+import urllib.parse
+
+from api_capture import parse_api_events
+from event_dates import parse_date
+
+# requests and BeautifulSoup are imported on first use, so runs that never
+# fetch over HTTP do not pay for importing them
+PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
+# JSON data embedded in <script> tags: framework hydration state and JSON-LD
+_JSON_SCRIPT = re.compile(
+    r"<script\b[^>]*(?:id=[\"']__NEXT_DATA__[\"']|id=[\"']__NUXT_DATA__[\"']"
+    r"|type=[\"']application/(?:ld\+)?json[\"'])[^>]*>(.*?)</script>",
+    re.DOTALL | re.IGNORECASE,
+)
+# window.__SOME_STATE__ = {...}; assignments that happen to be plain JSON
+_STATE_ASSIGNMENT = re.compile(
+    r"window\.__[A-Z_]+__\s*=\s*(\{.*?\})\s*;?\s*</script>", re.DOTALL
+)
+
+_MONTHS = re.compile(r"jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec", re.IGNORECASE)
+_HEADER_TAGS = ("h2", "h3", "h4")
+_SECTION_END = re.compile(r"^h[1-6]$")
+
+
+class HttpBackend:
+    """Fetch event pages with a pooled keep-alive ``requests`` session."""
+
+    def __init__(self, pool_size=4, timeout=30, user_agent=None):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "Accept": "text/html,application/xhtml+xml",
+            "Accept-Language": "en-US,en;q=0.9",
+        })
+        if user_agent:
+            self.session.headers["User-Agent"] = user_agent
+
+    def fetch(self, url):
+        """Return ``(html, bytes_transferred)``. Blocking; run it in a worker thread."""
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        return response.text, len(response.content)
+
+    def close(self):
+        self.session.close()
+
+
+def _text(el):
+    return el.get_text().strip() if el is not None else ""
+
+
+def _classes(el):
+    return " ".join(el.get("class") or [])
+
+
+def _link(el, page_url):
+    a = el if el.name == "a" else el.find("a", href=True)
+    if a is None or not a.get("href"):
+        return ""
+    href = urllib.parse.urljoin(page_url, a["href"])
+    return "" if href == page_url else href
+
+
+def hydration_events(html, page_url=""):
+    """Events found in JSON embedded in the page's <script> tags."""
+    events = []
+    blobs = _JSON_SCRIPT.findall(html) + _STATE_ASSIGNMENT.findall(html)
+    for blob in blobs:
+        try:
+            payload = json.loads(blob)
+        except ValueError:
+            continue
+        events.extend(parse_api_events(payload, page_url))
+    return events
+
+
+def html_events(html, page_url=""):
+    """Events found in the page markup: table rows, else dated sections."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, PARSER)
+    events = []
+
+    # Table rows: time, event, location cells
+    for row in soup.find_all("tr"):
+        cells = row.find_all(["td", "th"], recursive=False)
+        if len(cells) < 3:
+            continue
+        title = _text(cells[1])
+        if len(title) <= 3:
+            continue
+        row_text = row.get_text()
+        if "EVENT" in row_text and "LOCATION" in row_text and "TIME" in row_text:
+            continue
+        events.append({
+            "title": title,
+            "location": _text(cells[2]),
+            "time": _text(cells[0]),
+            "dateText": "",
+            "link": _link(row, page_url),
+        })
+    if events:
+        return events
+
+    # Dated sections: a date header followed by sibling event elements
+    headers = soup.find_all(
+        lambda tag: tag.name in _HEADER_TAGS or re.search("date|header", _classes(tag))
+    )
+    for header in headers:
+        header_text = _text(header)
+        if not re.search(r"\d", header_text) or not _MONTHS.search(header_text):
+            continue
+        for el in header.find_next_siblings():
+            if _SECTION_END.match(el.name) or "date" in _classes(el):
+                break
+            el_text = _text(el)
+            if len(el_text) <= 5:
+                continue
+            title = _text(el.select_one('[class*="title"]')) or el_text
+            if len(title) <= 3:
+                continue
+            events.append({
+                "title": title,
+                "location": _text(el.select_one('[class*="location"]')),
+                "time": _text(el.select_one('[class*="time"]')),
+                "dateText": header_text,
+                "link": _link(el, page_url),
+            })
+    return events
+
+
+def _in_month(event, month):
+    """Whether an event starts in ``month`` or the month before (events that
+    span the turn of the month)."""
+    date = parse_date(event["dateText"], month)
+    if date is None:
+        return False
+    months_before = (month.year - date.year) * 12 + month.month - date.month
+    return 0 <= months_before <= 1
+
+
+def extract_events(html, page_url="", month=None):
+    """Return ``(events, source)`` with ``source`` either "hydration" or "html".
+
+    Hydration blobs can carry more than the month's events (related videos,
+    news, other months), so with ``month`` (``YYYY-MM-DD``) only events
+    dated in that month count. When none are, the markup is parsed instead.
+    """
+    events = hydration_events(html, page_url)
+    if month is not None:
+        month = datetime.date.fromisoformat(month)
+        events = [event for event in events if _in_month(event, month)]
+    if events:
+        return events, "hydration"
+    return html_events(html, page_url), "html"
@@ -0,0 +1,107 @@
+"""Per-run and per-month instrumentation for the scraper.
+
+``RunMetrics`` collects, for every scraped month, how long each stage took
+(navigation, readiness, evaluate, parse, screenshot) along with counters such
+as events extracted, bytes transferred, retries and cache hits. At the end of
+a run it can be written as a JSON report and in the Prometheus textfile
+format, so runs can be compared over time.
+"""
+import contextlib
+import datetime
+import json
+import os
+import time
+
+STAGES = ("navigation", "readiness", "evaluate", "parse", "screenshot")
+
+# Numeric per-month fields summed into the run totals
+COUNTERS = ("events", "bytes_transferred", "requests_blocked", "retries")
+
+
+class RunMetrics:
+    def __init__(self):
+        self.started_at = datetime.datetime.now(datetime.timezone.utc)
+        self._started = time.perf_counter()
+        self.duration = None
+        # Month key -> dict of measurements
+        self.months = {}
+
+    def month(self, key):
+        return self.months.setdefault(key, {})
+
+    @contextlib.contextmanager
+    def stage(self, key, name):
+        """Time a stage of a month's fetch, accumulating over retries."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            timings = self.month(key).setdefault("timings", {})
+            timings[name] = round(timings.get(name, 0) + time.perf_counter() - started, 4)
+
+    def count(self, key, name, amount=1):
+        stats = self.month(key)
+        stats[name] = stats.get(name, 0) + amount
+
+    def finish(self):
+        self.duration = round(time.perf_counter() - self._started, 3)
+
+    def totals(self):
+        totals = {name: 0 for name in COUNTERS}
+        totals.update(months=len(self.months), cache_hits=0, errors=0)
+        stage_totals = {stage: 0.0 for stage in STAGES}
+        for stats in self.months.values():
+            for name in COUNTERS:
+                totals[name] += stats.get(name, 0)
+            totals["cache_hits"] += 1 if stats.get("cache_hit") else 0
+            totals["errors"] += 1 if stats.get("error") else 0
+            for stage, seconds in stats.get("timings", {}).items():
+                stage_totals[stage] = stage_totals.get(stage, 0.0) + seconds
+        totals["stage_seconds"] = {stage: round(seconds, 3) for stage, seconds in stage_totals.items()}
+        return totals
+
+    def report(self):
+        return {
+            "started_at": self.started_at.isoformat(),
+            "duration_seconds": self.duration,
+            "totals": self.totals(),
+            "months": self.months,
+        }
+
+    def write_json(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2, sort_keys=True)
+        print(f"Run report written to {path}")
+
+    def write_prometheus(self, path):
+        """Write the run in the node_exporter textfile collector format."""
+        totals = self.totals()
+        lines = [
+            "# HELP flo_scraper_run_duration_seconds Wall-clock time of the last run.",
+            "# TYPE flo_scraper_run_duration_seconds gauge",
+            f"flo_scraper_run_duration_seconds {self.duration or 0}",
+            "# HELP flo_scraper_last_run_timestamp_seconds Start time of the last run.",
+            "# TYPE flo_scraper_last_run_timestamp_seconds gauge",
+            f"flo_scraper_last_run_timestamp_seconds {self.started_at.timestamp():.0f}",
+        ]
+        for name in COUNTERS + ("months", "cache_hits", "errors"):
+            lines += [
+                f"# TYPE flo_scraper_{name} gauge",
+                f"flo_scraper_{name} {totals[name]}",
+            ]
+        lines += [
+            "# HELP flo_scraper_month_stage_seconds Time spent per month and stage.",
+            "# TYPE flo_scraper_month_stage_seconds gauge",
+        ]
+        for key, stats in sorted(self.months.items()):
+            for stage, seconds in sorted(stats.get("timings", {}).items()):
+                lines.append(f'flo_scraper_month_stage_seconds{{month="{key}",stage="{stage}"}} {seconds}')
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        # Atomic, so the collector never reads a half-written file
+        os.replace(temp_path, path)
+        print(f"Prometheus metrics written to {path}")
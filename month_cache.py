@@ -0,0 +1,117 @@
+"""On-disk cache of scraped months, so past months are not re-fetched every run.
+
+Each entry is keyed by month and a hash of the facet query, and stores the
+month's events together with a content hash and the time they were fetched.
+A ``CachePolicy`` decides how long an entry stays fresh: months in the past
+rarely change and are refreshed weekly, the current and future months on
+every run.
+"""
+import datetime
+import hashlib
+import json
+import os
+import sqlite3
+
+from event_dates import ensure_utc
+
+
+def facets_hash(facets):
+    """Stable short hash of a facet query."""
+    return hashlib.sha1(json.dumps(facets, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+
+
+def _dump_events(events):
+    return json.dumps(
+        [dict(event, pubDate=event["pubDate"].isoformat()) for event in events],
+        sort_keys=True,
+    )
+
+
+def _load_events(payload):
+    events = json.loads(payload)
+    for event in events:
+        event["pubDate"] = ensure_utc(datetime.datetime.fromisoformat(event["pubDate"]))
+    return events
+
+
+class CachePolicy:
+    """Time-to-live for cached months, depending on where they fall relative to today."""
+
+    def __init__(self, past_ttl=datetime.timedelta(days=7), current_ttl=datetime.timedelta(0)):
+        self.past_ttl = past_ttl
+        self.current_ttl = current_ttl
+
+    def ttl(self, date, today=None):
+        today = today or datetime.date.today()
+        month = datetime.date.fromisoformat(date).replace(day=1)
+        return self.past_ttl if month < today.replace(day=1) else self.current_ttl
+
+    def is_fresh(self, date, fetched_at, now=None):
+        now = now or datetime.datetime.now()
+        return now - fetched_at < self.ttl(date, now.date())
+
+
+class CachedMonth:
+    def __init__(self, events, content_hash, fetched_at):
+        self.events = events
+        self.content_hash = content_hash
+        self.fetched_at = fetched_at
+
+
+class MonthCache:
+    """SQLite store of per-month scrape results."""
+
+    def __init__(self, path="cache/months.sqlite3"):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS months (
+                month TEXT NOT NULL,
+                facets_hash TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                fetched_at TEXT NOT NULL,
+                changed_at TEXT NOT NULL,
+                events TEXT NOT NULL,
+                PRIMARY KEY (month, facets_hash)
+            )
+        """)
+        self.db.commit()
+
+    def get(self, date, facets):
+        row = self.db.execute(
+            "SELECT events, content_hash, fetched_at FROM months WHERE month = ? AND facets_hash = ?",
+            (date, facets_hash(facets)),
+        ).fetchone()
+        if row is None:
+            return None
+        events, content_hash, fetched_at = row
+        return CachedMonth(_load_events(events), content_hash, datetime.datetime.fromisoformat(fetched_at))
+
+    def put(self, date, facets, events, fetched_at=None):
+        """Store a month's events. Returns True if the content changed."""
+        fetched_at = (fetched_at or datetime.datetime.now()).isoformat()
+        payload = _dump_events(events)
+        content_hash = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        key = (date, facets_hash(facets))
+
+        row = self.db.execute(
+            "SELECT content_hash FROM months WHERE month = ? AND facets_hash = ?", key
+        ).fetchone()
+        changed = row is None or row[0] != content_hash
+        if changed:
+            self.db.execute(
+                "INSERT OR REPLACE INTO months (month, facets_hash, content_hash, fetched_at, changed_at, events)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                key + (content_hash, fetched_at, fetched_at, payload),
+            )
+        else:
+            self.db.execute(
+                "UPDATE months SET fetched_at = ? WHERE month = ? AND facets_hash = ?",
+                (fetched_at,) + key,
+            )
+        self.db.commit()
+        return changed
+
+    def close(self):
+        self.db.close()
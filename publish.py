@@ -0,0 +1,86 @@
+"""Work out which published files actually changed in a run.
+
+``docs/manifest.json`` records the SHA-256, size and last change time of
+every file under ``docs/``. After the outputs are written, ``Publisher.scan``
+hashes the files again and compares them with the manifest. The changed paths
+are written to a report (one per line, for ``git add --pathspec-from-file``)
+and, inside GitHub Actions, exposed as the step output ``changed``, so the
+workflow commits nothing when nothing changed. The manifest itself is only
+rewritten when something changed, and doubles as a list of ETags for clients.
+"""
+import datetime
+import hashlib
+import json
+import os
+
+MANIFEST_NAME = "manifest.json"
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class Publisher:
+    def __init__(self, directory="docs"):
+        self.directory = directory
+        self.manifest_path = os.path.join(directory, MANIFEST_NAME)
+        self.manifest = {}
+        if os.path.exists(self.manifest_path):
+            try:
+                with open(self.manifest_path, encoding="utf-8") as f:
+                    self.manifest = json.load(f).get("files", {})
+            except (OSError, ValueError) as e:
+                print(f"Ignoring unreadable manifest {self.manifest_path}: {e}")
+        # Paths (relative to the repository) added, modified or removed
+        self.changed = []
+
+    def _files(self):
+        for root, dirs, files in os.walk(self.directory):
+            dirs[:] = [name for name in dirs if not name.startswith(".")]
+            for name in files:
+                path = os.path.join(root, name)
+                # Skip temporary files of interrupted writes
+                if not name.startswith(".") and path != self.manifest_path:
+                    yield os.path.relpath(path, self.directory).replace(os.sep, "/"), path
+
+    def scan(self):
+        """Compare the files on disk with the manifest. Returns the changed paths."""
+        now = datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds")
+        files = {}
+        for name, path in sorted(self._files()):
+            entry = {"sha256": file_hash(path), "bytes": os.path.getsize(path)}
+            previous = self.manifest.get(name)
+            if previous and previous.get("sha256") == entry["sha256"]:
+                entry["changed_at"] = previous.get("changed_at", now)
+            else:
+                entry["changed_at"] = now
+                self.changed.append(path)
+            files[name] = entry
+        for name in sorted(set(self.manifest) - set(files)):
+            self.changed.append(os.path.join(self.directory, name))
+
+        if self.changed or not os.path.exists(self.manifest_path):
+            with open(self.manifest_path, "w", encoding="utf-8") as f:
+                json.dump({"files": files}, f, indent=1, sort_keys=True)
+                f.write("\n")
+            self.changed.append(self.manifest_path)
+        self.manifest = files
+        return self.changed
+
+    def write_report(self, path):
+        """List the changed paths in ``path`` and tell GitHub Actions about them."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.writelines(changed + "\n" for changed in self.changed)
+        github_output = os.environ.get("GITHUB_OUTPUT")
+        if github_output:
+            with open(github_output, "a", encoding="utf-8") as f:
+                f.write(f"changed={'true' if self.changed else 'false'}\n")
+        if self.changed:
+            print(f"{len(self.changed)} published files changed, listed in {path}")
+        else:
+            print("No published files changed")
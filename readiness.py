@@ -0,0 +1,117 @@
+"""Decide when an events page has rendered enough to be scraped.
+
+Each strategy exposes ``async wait(page)`` which returns the name of the
+condition that fired (or ``None`` if it gave up), so callers can record which
+strategy made the page ready and how long it took.
+"""
+import asyncio
+import time
+
+# Elements that only exist once the event list has rendered
+EVENT_LIST_SELECTORS = (
+    "table tbody tr td",
+    "[class*='event'][class*='row']",
+    "[class*='event'][class*='item']",
+    "[class*='event'][class*='card']",
+    "div[role='row']",
+)
+
+# Markers the page shows when a month has no events
+EMPTY_STATE_SELECTORS = (
+    "[class*='empty']",
+    "[class*='no-results']",
+    "[class*='noResults']",
+    ":text-matches('no (upcoming )?events', 'i')",
+)
+
+
+class SelectorReadiness:
+    """Ready as soon as any of ``selectors`` is attached to the page."""
+
+    def __init__(self, name, selectors, timeout=15000):
+        self.name = name
+        self.selectors = tuple(selectors)
+        self.timeout = timeout
+
+    async def wait(self, page):
+        try:
+            await page.wait_for_selector(", ".join(self.selectors), state="attached", timeout=self.timeout)
+        except Exception:
+            return None
+        return self.name
+
+
+class NetworkIdleReadiness:
+    """Ready once there has been no network traffic for 500 ms."""
+
+    name = "networkidle"
+
+    def __init__(self, timeout=30000):
+        self.timeout = timeout
+
+    async def wait(self, page):
+        try:
+            await page.wait_for_load_state("networkidle", timeout=self.timeout)
+        except Exception:
+            return None
+        return self.name
+
+
+class FirstReady:
+    """Race several strategies and stop at the first one that fires."""
+
+    def __init__(self, *strategies, name=None):
+        self.strategies = strategies
+        self.name = name or "|".join(s.name for s in strategies)
+
+    async def wait(self, page):
+        tasks = [asyncio.ensure_future(s.wait(page)) for s in self.strategies]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                result = await finished
+                if result:
+                    return result
+            return None
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+class Fallback:
+    """Try strategies in order until one of them fires."""
+
+    def __init__(self, *strategies, name=None):
+        self.strategies = strategies
+        self.name = name or ">".join(s.name for s in strategies)
+
+    async def wait(self, page):
+        for strategy in self.strategies:
+            result = await strategy.wait(page)
+            if result:
+                return result
+        return None
+
+
+def default_strategy(timeout=15000):
+    """Event list or empty-state marker, falling back to network idle."""
+    return Fallback(
+        FirstReady(
+            SelectorReadiness("event-list", EVENT_LIST_SELECTORS, timeout),
+            SelectorReadiness("empty-state", EMPTY_STATE_SELECTORS, timeout),
+        ),
+        NetworkIdleReadiness(timeout * 2),
+    )
+
+
+async def measure(strategy, page):
+    """Run ``strategy`` and return ``(condition, seconds_to_ready)``."""
+    started = time.perf_counter()
+    condition = await strategy.wait(page)
+    return condition, time.perf_counter() - started
+
+
+STRATEGIES = {
+    "auto": default_strategy,
+    "selector": lambda timeout=15000: SelectorReadiness("event-list", EVENT_LIST_SELECTORS, timeout),
+    "networkidle": lambda timeout=15000: NetworkIdleReadiness(timeout),
+}
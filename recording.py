@@ -0,0 +1,77 @@
+"""Record rendered month pages and replay them offline.
+
+``--record DIR`` saves the rendered HTML of every month the scraper visits
+(or the raw HTML, for months fetched over plain HTTP).
+``--replay DIR`` serves those snapshots back through Playwright route
+fulfilment and aborts every other request, so the full scraping pipeline can
+run (and be timed) on a machine with no network.
+"""
+import asyncio
+import glob
+import json
+import os
+import urllib.parse
+
+from month_cache import facets_hash
+
+RECORDINGS_DIR = "recordings"
+
+
+def snapshot_path(directory, date, facets):
+    return os.path.join(directory, f"{date}_{facets_hash(facets)}.html")
+
+
+def _write(path, html):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(html)
+
+
+class Recorder:
+    """Save the rendered HTML of each scraped month."""
+
+    def __init__(self, directory=RECORDINGS_DIR):
+        self.directory = directory
+
+    async def save(self, page, date, facets):
+        return await self.save_html(await page.content(), date, facets)
+
+    async def save_html(self, html, date, facets):
+        path = snapshot_path(self.directory, date, facets)
+        await asyncio.to_thread(_write, path, html)
+        return path
+
+
+class ReplayServer:
+    """Fulfil month page requests from recorded snapshots, offline."""
+
+    def __init__(self, directory=RECORDINGS_DIR, base_url="https://www.flograppling.com/events"):
+        self.directory = directory
+        self.base_url = base_url
+
+    def recorded_dates(self, facets):
+        """Months that have a snapshot for ``facets``, in order."""
+        suffix = f"_{facets_hash(facets)}.html"
+        paths = glob.glob(os.path.join(self.directory, "*" + suffix))
+        return sorted(os.path.basename(path)[:-len(suffix)] for path in paths)
+
+    async def attach(self, context):
+        await context.route("**/*", self._handle_route)
+
+    async def _handle_route(self, route):
+        request = route.request
+        if request.resource_type != "document" or not request.url.startswith(self.base_url):
+            await route.abort()
+            return
+
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(request.url).query)
+        date = query.get("date", [""])[0]
+        try:
+            facets = json.loads(query.get("facets", ["{}"])[0])
+            path = snapshot_path(self.directory, date, facets)
+            with open(path, encoding="utf-8") as f:
+                body = f.read()
+        except (OSError, ValueError):
+            await route.fulfill(status=404, content_type="text/html", body="<html><body></body></html>")
+            return
+        await route.fulfill(status=200, content_type="text/html; charset=utf-8", body=body)
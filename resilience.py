@@ -0,0 +1,76 @@
+"""Retries, backoff, a circuit breaker and a run deadline for month fetches.
+
+A failed month is retried with exponential backoff and full jitter. Every
+failure also counts towards a ``CircuitBreaker``: after too many in a row the
+site is taken to be down and the remaining months are skipped rather than
+each burning a full navigation timeout. A ``Deadline`` bounds the whole run,
+so a slow site cannot stretch it indefinitely.
+"""
+import random
+import time
+
+
+class RetryPolicy:
+    """How often to retry a month and how long to wait in between."""
+
+    def __init__(self, attempts=3, base_delay=2.0, max_delay=30.0):
+        self.attempts = max(1, attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt):
+        """Seconds to sleep after failed attempt number ``attempt`` (0-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """Trip after ``threshold`` consecutive failures; a success resets the count.
+
+    Once tripped it stays open for the rest of the run.
+    """
+
+    def __init__(self, threshold=5):
+        self.threshold = threshold
+        self.failures = 0
+        self.tripped = False
+
+    def reset(self):
+        self.failures = 0
+        self.tripped = False
+
+    def record_success(self):
+        self.failures = 0
+
+    def record_failure(self):
+        self.failures += 1
+        if self.threshold and self.failures >= self.threshold and not self.tripped:
+            self.tripped = True
+            print(f"Circuit breaker open after {self.failures} consecutive failures, "
+                  "skipping the remaining months")
+
+
+class Deadline:
+    """Point in time after which no new work is started. ``None`` means no limit."""
+
+    def __init__(self, seconds=None):
+        self.seconds = seconds
+        self.restart()
+
+    def restart(self):
+        self.expires_at = time.monotonic() + self.seconds if self.seconds else None
+
+    def remaining(self):
+        if self.expires_at is None:
+            return float("inf")
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self):
+        return self.remaining() <= 0
+
+    def timeout(self, limit=None):
+        """``limit`` capped by the time left, or None when neither applies."""
+        remaining = self.remaining()
+        if limit is None:
+            return None if remaining == float("inf") else remaining
+        return min(limit, remaining)
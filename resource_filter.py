@@ -0,0 +1,135 @@
+"""Block heavy or irrelevant requests (images, fonts, media, trackers) while scraping.
+
+Ad and analytics beacons keep the network busy long after the event list has
+rendered, and images, fonts and video players are never looked at by the
+scraper. Aborting them saves bandwidth and lets the page settle sooner.
+"""
+import urllib.parse
+
+DEFAULT_BLOCKED_TYPES = ("image", "media", "font")
+
+DEFAULT_BLOCKED_DOMAINS = (
+    "doubleclick.net",
+    "googlesyndication.com",
+    "googletagmanager.com",
+    "googletagservices.com",
+    "google-analytics.com",
+    "amazon-adsystem.com",
+    "adnxs.com",
+    "facebook.net",
+    "facebook.com",
+    "scorecardresearch.com",
+    "quantserve.com",
+    "chartbeat.com",
+    "chartbeat.net",
+    "hotjar.com",
+    "segment.com",
+    "segment.io",
+    "newrelic.com",
+    "nr-data.net",
+    "optimizely.com",
+    "taboola.com",
+    "outbrain.com",
+    "branch.io",
+    "jwplayer.com",
+    "jwpcdn.com",
+    "jwpltx.com",
+)
+
+
+def _matches(host, domains):
+    return any(host == domain or host.endswith("." + domain) for domain in domains)
+
+
+def _new_stats():
+    return {
+        "requests_allowed": 0,
+        "requests_blocked": 0,
+        "bytes_transferred": 0,
+        "blocked_by_type": {},
+    }
+
+
+class ResourceFilter:
+    """Route handler that aborts requests by resource type and domain.
+
+    A request is blocked when its resource type is in ``blocked_types`` or its
+    host is (a subdomain of) one of ``blocked_domains``. Hosts listed in
+    ``allowed_domains`` are exempt from the domain deny list, but not from
+    resource type blocking.
+
+    Counters are kept per month: call ``begin(page, date)`` before navigating
+    a page, ``stats(date)`` once the month is done and ``end(page, date)``
+    when the page moves on.
+    """
+
+    def __init__(self, blocked_types=DEFAULT_BLOCKED_TYPES,
+                 blocked_domains=DEFAULT_BLOCKED_DOMAINS, allowed_domains=()):
+        self.blocked_types = frozenset(blocked_types)
+        self.blocked_domains = tuple(blocked_domains)
+        self.allowed_domains = tuple(allowed_domains)
+        self._month_for_page = {}
+        self._stats = {}
+
+    def is_blocked(self, url, resource_type):
+        if resource_type in self.blocked_types:
+            return True
+        host = (urllib.parse.urlsplit(url).hostname or "").lower()
+        if _matches(host, self.allowed_domains):
+            return False
+        return _matches(host, self.blocked_domains)
+
+    async def attach(self, context):
+        """Install the filter on every page of a browser context."""
+        await context.route("**/*", self._handle_route)
+        context.on("response", self._on_response)
+
+    def begin(self, page, date):
+        """Attribute everything ``page`` loads from now on to ``date``."""
+        self._month_for_page[page] = date
+        self._stats[date] = _new_stats()
+
+    def stats(self, date):
+        return self._stats.get(date, _new_stats())
+
+    def end(self, page, date):
+        """Stop attributing requests from ``page`` and drop the counters for ``date``."""
+        if self._month_for_page.get(page) == date:
+            del self._month_for_page[page]
+        self._stats.pop(date, None)
+
+    def _bucket(self, request):
+        try:
+            page = request.frame.page
+        except Exception:
+            return None  # Service worker requests have no frame
+        date = self._month_for_page.get(page)
+        return self._stats.get(date) if date else None
+
+    async def _handle_route(self, route):
+        request = route.request
+        stats = self._bucket(request)
+        if self.is_blocked(request.url, request.resource_type):
+            if stats is not None:
+                stats["requests_blocked"] += 1
+                by_type = stats["blocked_by_type"]
+                by_type[request.resource_type] = by_type.get(request.resource_type, 0) + 1
+            await route.abort()
+        else:
+            if stats is not None:
+                stats["requests_allowed"] += 1
+            await route.continue_()
+
+    async def _on_response(self, response):
+        stats = self._bucket(response.request)
+        if stats is None:
+            return
+        # Content-Length is missing on chunked and compressed responses, the
+        # sizes Chromium reports are the bytes that actually came over the wire
+        try:
+            sizes = await response.request.sizes()
+        except Exception:
+            return  # The page was closed before the response finished
+        stats["bytes_transferred"] += (
+            max(sizes["responseHeadersSize"], 0) + max(sizes["responseBodySize"], 0)
+        )
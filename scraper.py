@@ -1,15 +1,179 @@
+import argparse
 import asyncio
 import datetime
+import glob
+import html
 import json
 import os
-import PyRSS2Gen
-from playwright.async_api import async_playwright
+import sys
+import time
 import urllib.parse
 
+from api_capture import ApiCapture, ApiRequestStore, parse_api_events, replay_requests
+from backfill import SPOOL_DIR, Spool, run_backfill
+from debug_artifacts import IMAGE_FORMATS as DEBUG_IMAGE_FORMATS, MODES as DEBUG_MODES, DebugArtifacts
+from event_dates import event_day, parse_event_datetime, parse_month
+from event_store import EventStore
+from extractor import DEFAULT_EXTRACTOR, EXTRACTORS
+from feed_writer import StreamingFeedWriter
+from feed_window import SHARD_FORMATS, archive_links, read_archive, shard, split_window
+from feeds import load_feeds, unique_queries
+from http_backend import HttpBackend, extract_events
+from metrics import RunMetrics
+from month_cache import CachePolicy, MonthCache, facets_hash
+from publish import Publisher
+from recording import RECORDINGS_DIR, Recorder, ReplayServer
+from readiness import STRATEGIES as READINESS_STRATEGIES, measure as measure_readiness
+from resilience import CircuitBreaker, Deadline, RetryPolicy
+from resource_filter import DEFAULT_BLOCKED_DOMAINS, DEFAULT_BLOCKED_TYPES, ResourceFilter
+from site_pages import SITE_URL, write_site
+
+
+class HostRateLimiter:
+    """Space out requests to the same host by a minimum interval."""
+
+    def __init__(self, min_interval=1.0):
+        self.min_interval = min_interval
+        self._next_slot = {}
+        self._lock = asyncio.Lock()
+
+    async def wait(self, url):
+        """Sleep until the host of ``url`` may be hit again."""
+        host = urllib.parse.urlsplit(url).netloc
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.min_interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+              '(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
+# The "No events found" item is the same every run, so an empty feed is not
+# rewritten (and committed) every day
+PLACEHOLDER_GUID = "https://www.flograppling.com/events#no-events"
+PLACEHOLDER_DATE = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+class BrowserSession:
+    """Launch Chromium on first use and share one context between pages.
+    
+    Without a ``playwright`` instance, Playwright itself is only imported and
+    started on first use too, so runs that never need the browser never load
+    it. With an ``endpoint`` (the WebSocket URL of a running Playwright browser
+    server) the session connects to that browser instead of launching one.
+    """
+
+    def __init__(self, playwright=None, routes=(), init_scripts=(), install_browser=False, endpoint=None):
+        self.playwright = playwright
+        self._owns_playwright = playwright is None
+        # Objects with an ``attach(context)`` coroutine that install route
+        # handlers; later ones take precedence, as with Playwright routes
+        self.routes = [route for route in routes if route is not None]
+        self.init_scripts = init_scripts
+        # Run ``playwright install chromium`` if the browser is missing
+        self.install_browser = install_browser
+        self.endpoint = endpoint
+        self.browser = None
+        self._context = None
+
+    async def _launch(self):
+        if self.endpoint:
+            return await self.playwright.chromium.connect(self.endpoint)
+        try:
+            return await self.playwright.chromium.launch(headless=True)
+        except Exception as e:
+            if not self.install_browser or "Executable doesn't exist" not in str(e):
+                raise
+        print("Chromium is not installed, installing it")
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "-m", "playwright", "install", "chromium"
+        )
+        await process.wait()
+        return await self.playwright.chromium.launch(headless=True)
+
+    async def context(self):
+        if self._context is None:
+            if self.playwright is None:
+                from playwright.async_api import async_playwright
+                
+                self.playwright = await async_playwright().start()
+            self.browser = await self._launch()
+            # Use a context with specific viewport and user agent
+            self._context = await self.browser.new_context(
+                viewport={'width': 1280, 'height': 800},
+                user_agent=USER_AGENT
+            )
+            for script in self.init_scripts:
+                await self._context.add_init_script(script)
+            for route in self.routes:
+                await route.attach(self._context)
+        return self._context
+
+    async def close(self):
+        if self.browser is not None:
+            await self.browser.close()
+        if self._owns_playwright and self.playwright is not None:
+            await self.playwright.stop()
+            self.playwright = None
+        self.browser = None
+        self._context = None
+
+
 class FloGrapplingEventScraper:
-    def __init__(self):
+    def __init__(self, concurrency=4, min_request_interval=1.0, api_mode="off", resource_filter=None,
+                 readiness=None, cache=None, cache_policy=None, extractor=DEFAULT_EXTRACTOR,
+                 recorder=None, replay=None, debug_artifacts=None, retry_policy=None,
+                 circuit_breaker=None, deadline=None, month_timeout=120, backend="auto",
+                 install_browser=False, browser_endpoint=None):
         self.base_url = "https://www.flograppling.com/events"
         self.facets = {"Streaming Source": "FloSports", "Event Type": "Brazilian Jiu-Jitsu"}
+        # Number of pages fetching months at the same time
+        self.concurrency = max(1, concurrency)
+        self.rate_limiter = HostRateLimiter(min_request_interval)
+        # "off": DOM scraping only, "capture": read events from the page's
+        # JSON API calls, "replay": re-issue captured API calls over HTTP
+        self.api_mode = api_mode
+        self.api_store = ApiRequestStore() if api_mode != "off" else None
+        self._http = None
+        # "auto": plain HTTP first and the browser only for months that came
+        # back empty, "http": never start a browser, "browser": always render
+        self.backend = backend
+        self.http = None
+        self.install_browser = install_browser
+        self.browser_endpoint = browser_endpoint
+        # Optional ResourceFilter that aborts images, fonts, media and trackers
+        self.resource_filter = resource_filter
+        # How to tell that a month's page has rendered (see readiness.py)
+        self.readiness = readiness or READINESS_STRATEGIES["auto"]()
+        # DOM extraction script, installed once per browser context
+        self.extractor = EXTRACTORS[extractor]
+        # Optional MonthCache; months that are still fresh are not re-fetched
+        self.cache = cache
+        self.cache_policy = cache_policy or CachePolicy()
+        # Optional Recorder saving rendered months, and ReplayServer serving
+        # them back offline instead of hitting the live site
+        self.recorder = recorder
+        self.replay = replay
+        # Screenshots/HTML of months that failed, off unless configured
+        self.debug_artifacts = debug_artifacts or DebugArtifacts(mode="off")
+        # Per-month stage timings and counters, written out as a run report
+        self.metrics = RunMetrics()
+        self.month_stats = self.metrics.months
+        # Retries with backoff, a breaker that stops the run when the site is
+        # down, a deadline for the whole run and a time limit per attempt
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.breaker = circuit_breaker or CircuitBreaker()
+        self.deadline = deadline or Deadline()
+        self.month_timeout = month_timeout
+    
+    def new_run(self):
+        """Start fresh metrics, breaker and deadline, e.g. for each watch cycle."""
+        self.metrics = RunMetrics()
+        self.month_stats = self.metrics.months
+        self.breaker.reset()
+        self.deadline.restart()
         
     def get_date_range(self):
         """Generate a list of dates from 1 year ago to 2 months in the future."""
@@ -39,485 +203,957 @@ class FloGrapplingEventScraper:
                 
         return date_list
     
-    def create_url(self, date):
+    def upcoming_months(self):
+        """The current and future months of the date range."""
+        this_month = datetime.date.today().replace(day=1).isoformat()
+        return [date for date in self.get_date_range() if date >= this_month]
+    
+    def create_url(self, date, facets=None):
         """Create the URL for a specific month."""
-        facets_string = urllib.parse.quote(json.dumps(self.facets))
+        facets_string = urllib.parse.quote(json.dumps(facets or self.facets))
         return f"{self.base_url}?date={date}&facets={facets_string}"
     
-    async def fetch_events_for_month(self, page, date):
-        """Fetch events for a specific month using Playwright."""
-        url = self.create_url(date)
-        print(f"Fetching events for {date} from {url}")
+    def month_key(self, date, facets=None):
+        """Key for per-month bookkeeping; plain ``date`` for the default facets."""
+        if facets is None or facets == self.facets:
+            return date
+        return f"{date}@{facets_hash(facets)}"
+    
+    def build_event(self, event_info, url, pub_date=None, month=None):
+        """Turn a raw extracted event (``title``, ``location``, ``time``,
+        ``dateText``, ``link``) into the event dict used for the feed.
         
-        try:
-            # Navigate to the URL
-            await page.goto(url, wait_until="networkidle", timeout=60000)
+        ``pub_date`` is parsed from the event's date and time text unless
+        given; ``month`` is the scraped month used to fill in missing dates.
+        """
+        title = event_info.get('title', '').strip()
+        if not title:
+            return None
+
+        location = event_info.get('location', '').strip()
+        time_text = event_info.get('time', '').strip()
+        date_text = event_info.get('dateText', '').strip()
+        link = event_info.get('link', '').strip() or url
+
+        if pub_date is None:
+            pub_date, _ = parse_event_datetime(date_text, time_text, month)
+        # Local date of the event, which the event store keys on
+        day, date_known = event_day(date_text, month)
+        
+        # Create description; the scraped text is escaped, it is not markup
+        description = f"<p><strong>{html.escape(title)}</strong></p>"
+        if date_text:
+            description += f"<p>Date: {html.escape(date_text)}</p>"
+        if time_text:
+            description += f"<p>Time: {html.escape(time_text)}</p>"
+        if location:
+            description += f"<p>Location: {html.escape(location)}</p>"
+        description += f"<p>View on FloGrappling: <a href='{html.escape(link)}'>{html.escape(title)}</a></p>"
+        
+        return {
+            'title': title,
+            'location': location,
+            'link': link,
+            'description': description,
+            'pubDate': pub_date,
+            'eventDate': day.isoformat(),
+            'dateKnown': date_known,
+            'guid': f"{link}#{title}"
+        }
+    
+    def build_events(self, event_data, url, month):
+        """Build the event dicts for one scraped month, parsing all dates in one batch."""
+        event_data = [info for info in event_data if info.get('title', '').strip()]
+        pub_dates = parse_month(
+            ((info.get('dateText', ''), info.get('time', '')) for info in event_data), month
+        )
+        unknown = sum(1 for _, date_known in pub_dates if not date_known)
+        if unknown:
+            print(f"No usable date for {unknown} events in {month}, using the first of the month")
+        return [
+            self.build_event(info, url, pub_date, month)
+            for info, (pub_date, _) in zip(event_data, pub_dates)
+        ]
+    
+    def add_known_events(self, events, date, url):
+        """Add events we know about but the page may not show."""
+        # If we should find the Pan Jiu Jitsu event but haven't yet
+        if "2025-03" in date and not any("Pan Jiu Jitsu IBJJF Championship" in event['title'] for event in events):
+            print("Manually adding known March 2025 event based on your screenshot")
             
-            # Wait for the page to load fully
-            await page.wait_for_load_state("networkidle")
+            # Add the event from your screenshot
+            event_date, _ = parse_event_datetime("March 19, 2025", "8:30 AM CDT")
+            title = "Pan Jiu Jitsu IBJJF Championship"
+            location = "Silver Spurs Arena - Kissimmee, FL"
             
-            # Wait additional time for any dynamic content
-            await asyncio.sleep(2)
+            description = (
+                f"<p><strong>{title}</strong></p>"
+                f"<p>Date: March 19, 2025</p>"
+                f"<p>Time: 8:30 AM CDT</p>"
+                f"<p>Location: {location}</p>"
+                f"<p>View on FloGrappling: <a href='{url}'>{title}</a></p>"
+            )
             
-            # Take a screenshot for debugging
-            os.makedirs("debug", exist_ok=True)
-            screenshot_path = f"debug/page_{date.replace('-', '_')}.png"
-            await page.screenshot(path=screenshot_path)
+            events.append({
+                'title': title,
+                'location': location,
+                'link': url,
+                'description': description,
+                'pubDate': event_date,
+                'eventDate': "2025-03-19",
+                'dateKnown': True,
+                'guid': f"{url}#pan-jiu-jitsu-2025"
+            })
+    
+    async def fetch_events_for_month(self, page, date, facets=None):
+        """Fetch events for a specific month using Playwright.
+        
+        Errors are recorded and re-raised; ``with_retries`` decides whether
+        to try again.
+        """
+        facets = facets or self.facets
+        key = self.month_key(date, facets)
+        url = self.create_url(date, facets)
+        print(f"Fetching events for {key} from {url}")
+        metrics = self.metrics
+        started = time.perf_counter()
+        
+        capture = ApiCapture() if self.api_mode != "off" else None
+        if capture:
+            page.on("response", capture.on_response)
+        if self.resource_filter is not None:
+            self.resource_filter.begin(page, key)
+        
+        try:
+            # Navigate to the URL, respecting the per-host rate limit
+            await self.rate_limiter.wait(url)
+            with metrics.stage(key, "navigation"):
+                await page.goto(url, wait_until="domcontentloaded", timeout=60000)
+            
+            # Wait until the event list (or the empty-state marker) has rendered
+            with metrics.stage(key, "readiness"):
+                condition, time_to_ready = await measure_readiness(self.readiness, page)
+            metrics.month(key).update(
+                ready_condition=condition,
+                time_to_ready=round(time_to_ready, 3),
+            )
+            print(f"Page for {key} ready after {time_to_ready:.2f}s ({condition or 'timed out'})")
             
-            # Perform a direct search for known event structural elements
-            selector_attempts = [
-                "table tbody tr",                     # Standard table rows
-                "[class*='event'][class*='row']",     # Event rows with classes containing 'event' and 'row'
-                "[class*='event'][class*='item']",    # Event items
-                "[class*='event'][class*='card']",    # Event cards
-                "tr:has(td)",                         # Any table row with td cells
-                "div[role='row']",                    # ARIA rows
-                ".event-row, .event-card, .event-item, .event-container" # Common class names
-            ]
+            if self.recorder is not None:
+                await self.recorder.save(page, date, facets)
             
             events = []
             
-            # Try directly getting March 19, 2025 event data from the page content
-            # This uses the page's intrinsic structure to find the event
-            event_data = await page.evaluate("""
-                () => {
-                    const events = [];
-                    
-                    // Look for table rows that might contain events
-                    const rows = Array.from(document.querySelectorAll('tr'));
-                    for (const row of rows) {
-                        const rowText = row.textContent.trim();
-                        
-                        // Skip header rows or empty rows
-                        if (!rowText || rowText.includes('EVENT') && rowText.includes('LOCATION') && rowText.includes('TIME')) {
-                            continue;
-                        }
-                        
-                        // Try to extract cells or structured content
-                        const cells = Array.from(row.querySelectorAll('td'));
-                        if (cells.length >= 3) {
-                            const timeCell = cells[0]?.textContent.trim();
-                            const eventCell = cells[1]?.textContent.trim(); 
-                            const locationCell = cells[2]?.textContent.trim();
-                            
-                            if (eventCell && eventCell.length > 3) {
-                                events.push({
-                                    title: eventCell,
-                                    location: locationCell || '',
-                                    time: timeCell || '',
-                                    dateText: '', // Will be populated from the page sections
-                                    link: row.querySelector('a')?.href || window.location.href
-                                });
-                            }
-                        }
-                    }
-                    
-                    // If we couldn't find table rows, look for dated sections with events
-                    if (events.length === 0) {
-                        // Look for date headers
-                        const dateHeaders = Array.from(document.querySelectorAll('h2, h3, h4, [class*="date"], [class*="header"]'));
-                        for (const header of dateHeaders) {
-                            const headerText = header.textContent.trim();
-                            if (!headerText) continue;
-                            
-                            // Check if it looks like a date (contains digits and possibly month names)
-                            const hasDatePattern = /\\d+/.test(headerText) && 
-                                                 (/jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec/i.test(headerText) ||
-                                                  /january|february|march|april|may|june|july|august|september|october|november|december/i.test(headerText));
-                            
-                            if (hasDatePattern) {
-                                // Look for event elements near this date header
-                                let eventElements = [];
-                                
-                                // Check following siblings until we hit another date header
-                                let element = header.nextElementSibling;
-                                while (element) {
-                                    // Stop if we hit another date header
-                                    if (element.tagName && /^H[1-6]$/.test(element.tagName) || 
-                                        element.className && element.className.includes('date')) {
-                                        break;
-                                    }
-                                    
-                                    // Check if this element contains event info
-                                    const elementText = element.textContent.trim();
-                                    if (elementText && elementText.length > 5) {
-                                        eventElements.push(element);
-                                    }
-                                    
-                                    element = element.nextElementSibling;
-                                }
-                                
-                                // Process found event elements
-                                for (const eventEl of eventElements) {
-                                    // Look for structured content or just use text
-                                    const title = eventEl.querySelector('[class*="title"]')?.textContent.trim() || 
-                                                eventEl.textContent.trim();
-                                    
-                                    const location = eventEl.querySelector('[class*="location"]')?.textContent.trim() || '';
-                                    const time = eventEl.querySelector('[class*="time"]')?.textContent.trim() || '';
-                                    
-                                    if (title && title.length > 3) {
-                                        events.push({
-                                            title: title,
-                                            location: location,
-                                            time: time,
-                                            dateText: headerText,
-                                            link: eventEl.querySelector('a')?.href || window.location.href
-                                        });
-                                    }
-                                }
-                            }
-                        }
-                    }
-                    
-                    // Specific search for the Pan Jiu Jitsu event
-                    const bodyText = document.body.textContent;
-                    if (bodyText.includes('Pan Jiu Jitsu IBJJF Championship')) {
-                        console.log('Found Pan Jiu Jitsu IBJJF Championship in body text');
-                        
-                        // Try to find the event in context
-                        const allElements = Array.from(document.querySelectorAll('*'));
-                        for (const el of allElements) {
-                            if (el.textContent.includes('Pan Jiu Jitsu IBJJF Championship')) {
-                                // Found element containing the text, now find its context
-                                const row = el.closest('tr') || el.closest('[class*="event"]') || el.closest('[class*="row"]');
-                                
-                                if (row) {
-                                    const locationEl = row.querySelector('[class*="location"]') || 
-                                                    Array.from(row.querySelectorAll('*')).find(e => e.textContent.includes('Arena') || e.textContent.includes('Kissimmee'));
-                                    
-                                    const timeEl = row.querySelector('[class*="time"]') || 
-                                                Array.from(row.querySelectorAll('*')).find(e => e.textContent.includes('AM') || e.textContent.includes('PM'));
-                                    
-                                    // Add if not already found
-                                    const isDuplicate = events.some(e => e.title.includes('Pan Jiu Jitsu IBJJF Championship'));
-                                    if (!isDuplicate) {
-                                        events.push({
-                                            title: 'Pan Jiu Jitsu IBJJF Championship',
-                                            location: locationEl ? locationEl.textContent.trim() : 'Silver Spurs Arena - Kissimmee, FL',
-                                            time: timeEl ? timeEl.textContent.trim() : '8:30 AM CDT',
-                                            dateText: 'March 19, 2025',
-                                            link: window.location.href
-                                        });
-                                    }
-                                }
-                            }
-                        }
-                    }
-                    
-                    // As a last resort, specifically check for March 2025
-                    if (bodyText.includes('March 19') || bodyText.includes('Mar 19') || bodyText.includes('03/19/2025')) {
-                        if (!events.some(e => e.dateText.includes('March 19') || e.dateText.includes('Mar 19'))) {
-                            // Scan for potential event elements
-                            const potentialEvents = [];
-                            const allElements = Array.from(document.querySelectorAll('*'));
-                            
-                            for (const el of allElements) {
-                                // Skip very common elements that are unlikely to be event containers
-                                if (['SCRIPT', 'STYLE', 'META', 'LINK', 'HTML', 'HEAD', 'BODY'].includes(el.tagName)) {
-                                    continue;
-                                }
-                                
-                                const text = el.textContent.trim();
-                                if (text.length > 10 && text.length < 200) {  // Reasonable text length for an event
-                                    // Check for event-like patterns (title-like content)
-                                    if (/Championship|Tournament|Open|Grand Prix|Cup|Challenge|Masters|Nationals|Worlds/i.test(text)) {
-                                        potentialEvents.push({
-                                            element: el,
-                                            text: text
-                                        });
-                                    }
-                                }
-                            }
-                            
-                            // Process potential events
-                            for (const {element, text} of potentialEvents) {
-                                // Skip if we already have this event
-                                if (events.some(e => e.title === text)) {
-                                    continue;
-                                }
-                                
-                                // Look for date indicators
-                                const hasDateIndicator = /March 19|Mar 19|03\/19\/2025|3\/19\/2025/i.test(
-                                    element.textContent || 
-                                    (element.previousElementSibling?.textContent || '') || 
-                                    (element.parentElement?.textContent || '')
-                                );
-                                
-                                if (hasDateIndicator) {
-                                    events.push({
-                                        title: text,
-                                        location: '', // May not be available
-                                        time: '',     // May not be available
-                                        dateText: 'March 19, 2025',
-                                        link: window.location.href
-                                    });
-                                }
-                            }
-                        }
-                    }
-                    
-                    return events;
-                }
-            """)
+            # Prefer structured event JSON from the page's own API calls
+            event_data = []
+            if capture:
+                event_data = await self.read_captured_api(key, capture, url)
             
-            print(f"Found {len(event_data)} events via JavaScript evaluation")
+            if not event_data:
+                with metrics.stage(key, "evaluate"):
+                    event_data = await self.extractor.run(page)
+                print(f"Found {len(event_data)} events via JavaScript evaluation ({self.extractor.version})")
             
             # Extract structured events or add manually if we have specific knowledge
-            if event_data:
-                for event_info in event_data:
-                    title = event_info.get('title', '').strip()
-                    if not title:
-                        continue
-                    
-                    location = event_info.get('location', '').strip()
-                    time_text = event_info.get('time', '').strip()
-                    date_text = event_info.get('dateText', '').strip()
-                    link = event_info.get('link', '').strip() or url
-                    
-                    # Parse date
-                    event_date = datetime.datetime.now()  # Default
-                    
-                    if date_text:
-                        # Try various date formats
-                        date_formats = [
-                            "%B %d, %Y",      # March 19, 2025
-                            "%b %d, %Y",      # Mar 19, 2025
-                            "%Y-%m-%d",       # 2025-03-19
-                            "%m/%d/%Y",       # 03/19/2025
-                        ]
-                        
-                        for fmt in date_formats:
-                            try:
-                                event_date = datetime.datetime.strptime(date_text, fmt)
-                                break
-                            except ValueError:
-                                continue
-                    
-                    # Try to add time if available
-                    if time_text and ":" in time_text:
-                        try:
-                            # Extract hour and minute
-                            time_parts = time_text.split()
-                            time_value = time_parts[0]
-                            am_pm = ""
-                            if len(time_parts) > 1:
-                                am_pm = time_parts[1].upper()
-                            
-                            # Parse time components
-                            if ":" in time_value:
-                                hour, minute = map(int, time_value.split(":")[:2])
-                                
-                                # Adjust for PM
-                                if "PM" in am_pm and hour < 12:
-                                    hour += 12
-                                elif "AM" in am_pm and hour == 12:
-                                    hour = 0
-                                
-                                # Update the datetime
-                                event_date = event_date.replace(hour=hour, minute=minute)
-                        except Exception as e:
-                            print(f"Error parsing time '{time_text}': {e}")
-                    
-                    # Create description
-                    description = f"<p><strong>{title}</strong></p>"
-                    if date_text:
-                        description += f"<p>Date: {date_text}</p>"
-                    if time_text:
-                        description += f"<p>Time: {time_text}</p>"
-                    if location:
-                        description += f"<p>Location: {location}</p>"
-                    description += f"<p>View on FloGrappling: <a href='{link}'>{title}</a></p>"
-                    
-                    # Add to our events list
-                    events.append({
-                        'title': title,
-                        'link': link,
-                        'description': description,
-                        'pubDate': event_date,
-                        'guid': f"{link}#{title}"
-                    })
+            with metrics.stage(key, "parse"):
+                events.extend(self.build_events(event_data, url, date))
             
-            # If we should find the Pan Jiu Jitsu event but haven't yet
-            if "2025-03" in date and not any("Pan Jiu Jitsu IBJJF Championship" in event['title'] for event in events):
-                print("Manually adding known March 2025 event based on your screenshot")
-                
-                # Add the event from your screenshot
-                event_date = datetime.datetime(2025, 3, 19, 8, 30)
-                title = "Pan Jiu Jitsu IBJJF Championship"
-                location = "Silver Spurs Arena - Kissimmee, FL"
-                
-                description = (
-                    f"<p><strong>{title}</strong></p>"
-                    f"<p>Date: March 19, 2025</p>"
-                    f"<p>Time: 8:30 AM CDT</p>"
-                    f"<p>Location: {location}</p>"
-                    f"<p>View on FloGrappling: <a href='{url}'>{title}</a></p>"
-                )
-                
-                events.append({
-                    'title': title,
-                    'link': url,
-                    'description': description,
-                    'pubDate': event_date,
-                    'guid': f"{url}#pan-jiu-jitsu-2025"
-                })
+            self.add_known_events(events, date, url)
             
-            print(f"Total events found for {date}: {len(events)}")
+            print(f"Total events found for {key}: {len(events)}")
+            if self.debug_artifacts.wants(events):
+                with metrics.stage(key, "screenshot"):
+                    await self.debug_artifacts.capture(page, key, "no events" if not events else "")
+            metrics.month(key).update(
+                events=len(events),
+                fetch_time=round(time.perf_counter() - started, 3),
+            )
+            if self.resource_filter is not None:
+                stats = self.resource_filter.stats(key)
+                metrics.month(key).update(
+                    bytes_transferred=stats['bytes_transferred'],
+                    requests_blocked=stats['requests_blocked'],
+                )
+                print(f"Requests for {key}: {stats['requests_allowed']} allowed, "
+                      f"{stats['requests_blocked']} blocked {stats['blocked_by_type']}, "
+                      f"{stats['bytes_transferred']} bytes transferred")
             return events
             
         except Exception as e:
-            print(f"Error fetching events for {date}: {e}")
+            print(f"Error fetching events for {key}: {e}")
+            metrics.month(key)["error"] = str(e)
+            if self.debug_artifacts.wants([], error=e):
+                with metrics.stage(key, "screenshot"):
+                    await self.debug_artifacts.capture(page, key, "error")
+            raise
+        finally:
+            if capture:
+                page.remove_listener("response", capture.on_response)
+            if self.resource_filter is not None:
+                self.resource_filter.end(page, key)
+    
+    async def fetch_month_http(self, date, facets=None):
+        """Fetch events for a month without a browser, from the page's HTML.
+        
+        Returns ``[]`` when the page has no events in its markup or embedded
+        JSON, e.g. because it is only rendered client side.
+        """
+        facets = facets or self.facets
+        key = self.month_key(date, facets)
+        url = self.create_url(date, facets)
+        metrics = self.metrics
+        
+        await self.rate_limiter.wait(url)
+        with metrics.stage(key, "navigation"):
+            html, size = await asyncio.to_thread(self.http.fetch, url)
+        metrics.count(key, "bytes_transferred", size)
+        if self.recorder is not None:
+            await self.recorder.save_html(html, date, facets)
+        
+        with metrics.stage(key, "evaluate"):
+            event_data, source = await asyncio.to_thread(extract_events, html, url, date)
+        with metrics.stage(key, "parse"):
+            events = self.build_events(event_data, url, date)
+        if events:
+            self.add_known_events(events, date, url)
+        
+        print(f"Found {len(events)} events for {key} over HTTP (from the page {source})")
+        metrics.month(key).update(backend="http", events=len(events))
+        return events
+    
+    async def _fetch_http(self, dates, facets):
+        semaphore = asyncio.Semaphore(self.concurrency)
+        
+        async def fetch(date):
+            key = self.month_key(date, facets)
+            async with semaphore:
+                if self.backend == "http":
+                    return await self.with_retries(key, lambda number: self.fetch_month_http(date, facets))
+                # The browser is the fallback, so a failure here is not retried
+                # and does not count towards the circuit breaker
+                try:
+                    return await asyncio.wait_for(
+                        self.fetch_month_http(date, facets), self.deadline.timeout(self.month_timeout)
+                    )
+                except Exception as e:
+                    print(f"HTTP fetch failed for {key}: {e or type(e).__name__}")
+                    return []
+        
+        return await asyncio.gather(*(fetch(date) for date in dates))
+    
+    async def with_retries(self, key, attempt):
+        """Run ``attempt(number)`` for a month until it succeeds.
+        
+        Failed attempts are retried with backoff. Nothing is attempted once
+        the circuit breaker is open or the run deadline has passed. Returns
+        the events, or ``[]`` when the month could not be fetched, in which
+        case its stats carry an ``error``.
+        """
+        stats = self.metrics.month(key)
+        attempts = self.retry_policy.attempts
+        for number in range(attempts):
+            if self.breaker.tripped:
+                stats["error"] = stats.get("error") or "skipped, circuit breaker open"
+                return []
+            timeout = self.deadline.timeout(self.month_timeout)
+            if timeout is not None and timeout <= 0:
+                print(f"Run deadline reached, skipping {key}")
+                stats["error"] = stats.get("error") or "skipped, run deadline reached"
+                return []
+            if number:
+                self.metrics.count(key, "retries")
+            
+            try:
+                events = await asyncio.wait_for(attempt(number), timeout)
+            except Exception as e:
+                stats["error"] = str(e) or type(e).__name__
+                self.breaker.record_failure()
+                if number + 1 < attempts and not self.breaker.tripped:
+                    delay = min(self.retry_policy.delay(number), self.deadline.remaining())
+                    print(f"Attempt {number + 1} of {attempts} for {key} failed, retrying in {delay:.1f}s")
+                    await asyncio.sleep(delay)
+                continue
+            
+            self.breaker.record_success()
+            stats.pop("error", None)
+            return events
+        
+        print(f"Giving up on {key} after {attempts} attempts")
+        return []
+    
+    async def read_captured_api(self, key, capture, url):
+        """Parse events out of the JSON responses captured while loading a month.
+        
+        The requests that produced events are remembered so later runs can
+        replay them without a browser.
+        """
+        event_data = []
+        specs = []
+        for spec, payload in await capture.collect():
+            found = parse_api_events(payload, url)
+            if found:
+                event_data.extend(found)
+                specs.append(spec)
+        
+        if specs:
+            self.api_store.put(key, specs)
+        print(f"Found {len(event_data)} events in {len(capture.responses)} captured API responses")
+        return event_data
+    
+    async def replay_api_month(self, date, facets=None):
+        """Fetch a month by replaying its recorded API requests over HTTP."""
+        key = self.month_key(date, facets)
+        specs = self.api_store.get(key)
+        if not specs:
             return []
+        
+        url = self.create_url(date, facets)
+        if self._http is None:
+            if self.http is not None:
+                self._http = self.http.session
+            else:
+                import requests
+                
+                self._http = requests.Session()
+        
+        try:
+            for spec in specs:
+                await self.rate_limiter.wait(spec["url"])
+            event_data = await asyncio.to_thread(replay_requests, self._http, specs, url)
+        except Exception as e:
+            print(f"Error replaying API requests for {key}: {e}")
+            return []
+        
+        events = self.build_events(event_data, url, date)
+        print(f"Replayed {len(specs)} API requests for {key}: {len(events)} events")
+        return events
+    
+    async def fetch_months(self, session, dates, facets=None):
+        """Fetch several months concurrently over a bounded pool of pages.
+        
+        Results are returned as one list of events per month, in the same
+        order as ``dates``, regardless of which fetch finished first. In
+        replay mode months with recorded API requests are fetched over plain
+        HTTP and the browser is only started for the rest.
+        """
+        facets = facets or self.facets
+        results = {}
+        cached = {}
+        if self.cache is not None:
+            for date in dates:
+                entry = self.cache.get(date, facets)
+                if entry is None:
+                    continue
+                cached[date] = entry
+                if self.cache_policy.is_fresh(date, entry.fetched_at):
+                    results[date] = entry.events
+                    self.metrics.month(self.month_key(date, facets))["cache_hit"] = True
+            if results:
+                print(f"Using cached results for {len(results)} of {len(dates)} months")
+        
+        stale = [date for date in dates if date not in results]
+        fetched = {}
+        if stale and self.api_mode == "replay":
+            replayed = await asyncio.gather(*(self.replay_api_month(date, facets) for date in stale))
+            fetched = {date: events for date, events in zip(stale, replayed) if events}
+        
+        pending = [date for date in stale if date not in fetched]
+        if pending and self.http is not None:
+            for date, events in zip(pending, await self._fetch_http(pending, facets)):
+                if events or self.backend == "http":
+                    fetched[date] = events
+            pending = [date for date in pending if date not in fetched]
+            if pending:
+                print(f"No events over HTTP for {len(pending)} months, falling back to the browser")
+        
+        if pending:
+            fetched.update(zip(pending, await self._fetch_pages(await session.context(), pending, facets)))
+        
+        for date, events in fetched.items():
+            stats = self.metrics.month(self.month_key(date, facets))
+            if stats.get("error"):
+                # Failed or skipped months are never cached, so the next run
+                # retries them; serve the last good result if there is one
+                if date in cached:
+                    print(f"Falling back to cached events for {date}")
+                    events = cached[date].events
+            elif self.cache is not None:
+                stats["changed"] = self.cache.put(date, facets, events)
+            results[date] = events
+        
+        return [results[date] for date in dates]
+    
+    async def _fetch_pages(self, context, dates, facets):
+        pool = asyncio.Queue()
+        for _ in range(min(self.concurrency, len(dates))):
+            pool.put_nowait(await context.new_page())
+        semaphore = asyncio.Semaphore(self.concurrency)
+        
+        async def fetch(date):
+            async with semaphore:
+                page = await pool.get()
+                
+                async def attempt(number):
+                    nonlocal page
+                    if number:
+                        # Retry on a fresh page in case the old one crashed or hung
+                        await self._close_page(page)
+                        page = await context.new_page()
+                    return await self.fetch_events_for_month(page, date, facets)
+                
+                try:
+                    return await self.with_retries(self.month_key(date, facets), attempt)
+                finally:
+                    pool.put_nowait(page)
+        
+        try:
+            return await asyncio.gather(*(fetch(date) for date in dates))
+        finally:
+            while not pool.empty():
+                await self._close_page(pool.get_nowait())
+    
+    async def _close_page(self, page):
+        try:
+            await page.close()
+        except Exception:
+            pass  # Already closed, or the page crashed
     
     async def fetch_all_events(self):
         """Fetch events for all months in the date range."""
+        return (await self.fetch_queries([self.facets]))[0]
+    
+    def browser_session(self):
+        """A ``BrowserSession`` set up for this scraper; Chromium (and
+        Playwright) only start if a month needs the browser."""
+        return BrowserSession(
+            routes=[self.resource_filter, self.replay],
+            init_scripts=[self.extractor.init_script],
+            install_browser=self.install_browser,
+            endpoint=self.browser_endpoint,
+        )
+    
+    def open_http(self):
+        if self.http is None and self.backend != "browser":
+            self.http = HttpBackend(pool_size=self.concurrency, user_agent=USER_AGENT)
+    
+    def close_http(self):
+        if self.http is not None:
+            self.http.close()
+        self.http = None
+        self._http = None
+    
+    async def fetch_queries(self, facet_queries, session=None, dates=None):
+        """Fetch events for several facet queries, sharing one browser.
+        
+        Returns one list of events per query, in the same order. A
+        ``session`` passed in is left open, along with the HTTP connection
+        pool, so they stay warm for the next call. ``dates`` limits the run
+        to those months.
+        """
+        results = []
+        owns_session = session is None
+        if owns_session:
+            session = self.browser_session()
+        self.open_http()
+        try:
+            for facets in facet_queries:
+                results.append(await self._fetch_query(session, facets, dates))
+        finally:
+            if owns_session:
+                await session.close()
+                self.close_http()
+        
+        await self.debug_artifacts.flush()
+        if self.api_store is not None:
+            self.api_store.save()
+        
+        return results
+    
+    async def _fetch_query(self, session, facets, dates=None):
         all_events = []
+        if dates is not None:
+            for monthly_events in await self.fetch_months(session, dates, facets):
+                all_events.extend(monthly_events)
+            return all_events
+        
         date_range = self.get_date_range()
+        if self.replay is not None:
+            # Offline: only the recorded months can be served
+            date_range = self.replay.recorded_dates(facets)
+            print(f"Replaying {len(date_range)} recorded months from {self.replay.directory}")
+        
+        # Process only a few specific months to start
+        test_months = ["2025-03-01", "2024-11-01", "2025-05-01"]
+        test_dates = [d for d in date_range if any(d.startswith(m[:7]) for m in test_months)]
+        
+        if test_dates:
+            print(f"Testing with {len(test_dates)} specific months first")
+            for monthly_events in await self.fetch_months(session, test_dates, facets):
+                all_events.extend(monthly_events)
+        
+        # If we still have no events, try all months
+        if not all_events and not self.breaker.tripped:
+            print("No events found in test months, trying all dates")
+            remaining = [d for d in date_range if d not in test_dates]  # Skip already processed dates
+            for monthly_events in await self.fetch_months(session, remaining, facets):
+                all_events.extend(monthly_events)
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            
-            # Use a context with specific viewport and user agent
-            context = await browser.new_context(
-                viewport={'width': 1280, 'height': 800},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            )
-            
-            page = await context.new_page()
-            
-            # Process only a few specific months to start
-            test_months = ["2025-03-01", "2024-11-01", "2025-05-01"]
-            test_dates = [d for d in date_range if any(d.startswith(m[:7]) for m in test_months)]
-            
-            if test_dates:
-                print(f"Testing with {len(test_dates)} specific months first")
-                for date in test_dates:
-                    monthly_events = await self.fetch_events_for_month(page, date)
-                    all_events.extend(monthly_events)
-                    await asyncio.sleep(1)
-            
-            # If we still have no events, try all months
-            if not all_events:
-                print("No events found in test months, trying all dates")
-                for date in date_range:
-                    if date not in test_dates:  # Skip already processed dates
-                        monthly_events = await self.fetch_events_for_month(page, date)
-                        all_events.extend(monthly_events)
-                        await asyncio.sleep(1)
-            
-            await browser.close()
-            
         return all_events
     
-    def create_rss_feed(self, events, output_path="docs/flograppling_events.xml"):
-        """Create an RSS feed from the events."""
-        if not events:
-            print("No events to include in the feed.")
-            # Create an empty feed with a message
-            rss = PyRSS2Gen.RSS2(
-                title="FloGrappling BJJ Events",
-                link="https://www.flograppling.com/events",
-                description="Upcoming and past BJJ events from FloGrappling",
-                lastBuildDate=datetime.datetime.now(),
-                items=[
-                    PyRSS2Gen.RSSItem(
-                        title="No events found",
-                        link="https://www.flograppling.com/events",
-                        description="No events were found in the scrape. This could be due to website changes or no events being scheduled.",
-                        guid=PyRSS2Gen.Guid("https://www.flograppling.com/events#no-events-" + datetime.datetime.now().strftime("%Y%m%d")),
-                        pubDate=datetime.datetime.now()
-                    )
-                ]
-            )
-        else:
-            rss_items = []
+    def create_rss_feed(self, events, output_path="docs/flograppling_events.xml",
+                        title="FloGrappling BJJ Events",
+                        description="Upcoming and past BJJ events from FloGrappling",
+                        placeholder=True, links=(), archive=False):
+        """Create an RSS feed from the events.
+        
+        ``events`` can be any iterable; items are streamed to disk one by one.
+        The feed is only rewritten, and its ``lastBuildDate`` only moves, when
+        its items changed. Without ``placeholder`` an empty feed stays empty
+        instead of getting a "No events found" item. ``links`` and
+        ``archive`` add RFC 5005 paging (see ``feed_window.py``). Returns
+        ``output_path``.
+        """
+        writer = StreamingFeedWriter(
+            output_path,
+            title=title,
+            link="https://www.flograppling.com/events",
+            description=description,
+            links=links,
+            archive=archive,
+        )
+        with writer:
             for event in events:
                 try:
-                    rss_item = PyRSS2Gen.RSSItem(
+                    writer.add_item(
                         title=event['title'],
                         link=event['link'],
                         description=event['description'],
-                        guid=PyRSS2Gen.Guid(event['guid']),
-                        pubDate=event['pubDate']
+                        guid=event['guid'],
+                        pub_date=event['pubDate'],
+                        guid_is_permalink=event['guid'].startswith("http"),
                     )
-                    rss_items.append(rss_item)
                 except Exception as e:
                     print(f"Error creating RSS item: {e}")
             
-            rss = PyRSS2Gen.RSS2(
-                title="FloGrappling BJJ Events",
-                link="https://www.flograppling.com/events",
-                description="Upcoming and past BJJ events from FloGrappling",
-                lastBuildDate=datetime.datetime.now(),
-                items=rss_items
-            )
+            if not writer.item_count and placeholder:
+                print("No events to include in the feed.")
+                # Create an empty feed with a message
+                writer.add_item(
+                    title="No events found",
+                    link="https://www.flograppling.com/events",
+                    description="No events were found in the scrape. This could be due to website changes or no events being scheduled.",
+                    guid=PLACEHOLDER_GUID,
+                    pub_date=PLACEHOLDER_DATE,
+                )
         
-        os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            rss.write_xml(f)
-            
-        print(f"RSS feed created at {output_path}")
+        if writer.changed:
+            print(f"RSS feed created at {output_path}")
+        else:
+            print(f"RSS feed at {output_path} is unchanged, not rewriting it")
         return output_path
+    
+    def create_changes_feed(self, changes, output_path, title, description):
+        """Create a feed of new and updated events from ``EventStore.changes``.
+        
+        Each change is its own item, dated when it happened, so readers see
+        an update to an event they already have.
+        """
+        items = []
+        for event in changes:
+            changed_at = event['changed_at'].astimezone(datetime.timezone.utc)
+            is_new = event['first_seen'] == event['changed_at']
+            items.append({
+                'title': f"{'New' if is_new else 'Updated'}: {event['title']}",
+                'link': event['link'],
+                'description': event['description'],
+                'pubDate': changed_at,
+                'guid': f"{event['guid']}:{changed_at.strftime('%Y%m%dT%H%M%SZ')}",
+            })
+        return self.create_rss_feed(items, output_path, title, description, placeholder=False)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Build the FloGrappling BJJ events RSS feed.")
+    parser.add_argument("--backend", choices=["auto", "http", "browser"], default="auto",
+                        help="'auto' reads each month's server-rendered HTML over plain HTTP and "
+                             "only starts Chromium for months that came back empty, 'http' never "
+                             "starts a browser, 'browser' always renders with Playwright")
+    parser.add_argument("--install-browser", action="store_true",
+                        help="install Chromium with 'playwright install' if the browser fallback "
+                             "needs it and it is missing")
+    parser.add_argument("--concurrency", type=int, default=4,
+                        help="number of months fetched in parallel (default: 4)")
+    parser.add_argument("--min-request-interval", type=float, default=1.0,
+                        help="minimum seconds between requests to the same host (default: 1.0)")
+    parser.add_argument("--api-mode", choices=["off", "capture", "replay"], default="off",
+                        help="read events from the page's JSON API: 'capture' records the API "
+                             "requests while browsing, 'replay' re-issues them over HTTP and only "
+                             "falls back to the browser for months without a working recording")
+    parser.add_argument("--readiness", choices=sorted(READINESS_STRATEGIES), default="auto",
+                        help="how to detect that a month's page has rendered: 'auto' waits for the "
+                             "event list or an empty-state marker and falls back to network idle")
+    parser.add_argument("--ready-timeout", type=int, default=15000,
+                        help="milliseconds to wait for readiness (default: 15000)")
+    parser.add_argument("--extractor", choices=sorted(EXTRACTORS), default=DEFAULT_EXTRACTOR,
+                        help="DOM extraction script version (default: %(default)s)")
+    parser.add_argument("--cache", default="cache/months.sqlite3",
+                        help="SQLite file caching per-month results (default: %(default)s)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="fetch every month and do not read or write the cache")
+    parser.add_argument("--past-month-ttl-days", type=float, default=7,
+                        help="days before a cached past month is fetched again (default: 7)")
+    parser.add_argument("--current-month-ttl-hours", type=float, default=0,
+                        help="hours before the cached current or a future month is fetched again "
+                             "(default: 0, i.e. every run)")
+    parser.add_argument("--block-resource-types", default=",".join(DEFAULT_BLOCKED_TYPES),
+                        help="comma separated Playwright resource types to abort "
+                             "(default: %(default)s; pass an empty string to allow all)")
+    parser.add_argument("--block-domain", action="append", default=[],
+                        help="extra domain to block, on top of the built-in tracker list (repeatable)")
+    parser.add_argument("--allow-domain", action="append", default=[],
+                        help="domain exempt from domain blocking (repeatable)")
+    parser.add_argument("--no-resource-filter", action="store_true",
+                        help="load every resource the page requests")
+    parser.add_argument("--debug-artifacts", choices=DEBUG_MODES, default="off",
+                        help="save screenshots to debug/: 'failures' only for months with no events "
+                             "or an error, 'always' for every month (default: off)")
+    parser.add_argument("--debug-format", choices=DEBUG_IMAGE_FORMATS, default="jpeg",
+                        help="screenshot format; webp needs Pillow (default: jpeg)")
+    parser.add_argument("--debug-html", action="store_true",
+                        help="also save the rendered HTML next to each screenshot")
+    parser.add_argument("--debug-keep", type=int, default=30,
+                        help="maximum number of files kept in debug/ (default: 30)")
+    parser.add_argument("--feeds", default="feeds.json",
+                        help="JSON file defining the feeds to build (default: %(default)s)")
+    parser.add_argument("--event-store", default="cache/events.sqlite3",
+                        help="SQLite store of every event seen, used to build the feed "
+                             "(default: %(default)s)")
+    parser.add_argument("--record", nargs="?", const=RECORDINGS_DIR, metavar="DIR",
+                        help="save the rendered HTML of every month to DIR (default: %(const)s)")
+    parser.add_argument("--replay", nargs="?", const=RECORDINGS_DIR, metavar="DIR",
+                        help="serve months from HTML recorded with --record instead of the live "
+                             "site; implies --no-cache and no rate limiting")
+    parser.add_argument("--attempts", type=int, default=3,
+                        help="tries per month before giving up on it (default: 3)")
+    parser.add_argument("--retry-base-delay", type=float, default=2.0,
+                        help="base seconds of the jittered exponential backoff between tries "
+                             "(default: 2.0)")
+    parser.add_argument("--breaker-threshold", type=int, default=5,
+                        help="consecutive failed tries after which the site is considered down "
+                             "and the run stops without touching the published feeds "
+                             "(default: 5, 0 disables)")
+    parser.add_argument("--month-timeout", type=float, default=120,
+                        help="seconds one try at a month may take (default: 120)")
+    parser.add_argument("--deadline", type=float, metavar="SECONDS",
+                        help="overall time budget; months not started by then are skipped and "
+                             "served from the cache if possible")
+    parser.add_argument("--site-url", default=SITE_URL,
+                        help="public URL of docs/, used for links inside the feeds "
+                             "(default: %(default)s)")
+    parser.add_argument("--feed-max-items", type=int, default=100,
+                        help="cap on the items in each main feed, upcoming events first "
+                             "(default: 100, 0 for no cap); the rest go to archive feeds")
+    parser.add_argument("--archive-shard", choices=sorted(SHARD_FORMATS), default="year",
+                        help="split archive feeds per year or per month (default: year)")
+    parser.add_argument("--changes-days", type=float, default=7,
+                        help="how far back the feed of new and updated events goes (default: 7)")
+    parser.add_argument("--changes-report", default="reports/changed_files.txt", metavar="PATH",
+                        help="list the published files that changed in PATH (default: %(default)s; "
+                             "pass an empty string to skip)")
+    parser.add_argument("--feeds-only", action="store_true",
+                        help="rebuild the feeds and pages from the event store without scraping")
+    parser.add_argument("--watch", type=float, metavar="MINUTES",
+                        help="keep running: after a full first run, refresh only the current and "
+                             "upcoming months every MINUTES, keeping the browser warm")
+    parser.add_argument("--browser-endpoint", metavar="WS_URL",
+                        help="connect to a running Playwright browser server instead of "
+                             "launching Chromium")
+    parser.add_argument("--backfill", nargs=2, metavar=("START", "END"),
+                        help="fetch every month from START to END (YYYY-MM) for all feeds over "
+                             "--workers processes, merge them into the event store and rebuild "
+                             "the feeds; an interrupted backfill resumes from its spool")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="backfill worker processes, each with its own browser "
+                             "(default: number of CPUs)")
+    parser.add_argument("--spool", default=SPOOL_DIR, metavar="DIR",
+                        help="where backfill workers spool finished months (default: %(default)s)")
+    parser.add_argument("--backfill-reset", action="store_true",
+                        help="discard the spool of an earlier backfill and fetch every month again")
+    parser.add_argument("--metrics-json", default="reports/run_report.json", metavar="PATH",
+                        help="write per-month timings and counters as JSON (default: %(default)s; "
+                             "pass an empty string to skip)")
+    parser.add_argument("--metrics-prom", metavar="PATH",
+                        help="also write the run metrics in Prometheus textfile format")
+    parser.add_argument("--profile", nargs="?", const="reports/profile.pstats", metavar="PATH",
+                        help="run under cProfile, save the stats to PATH (default: %(const)s) "
+                             "and print the slowest functions")
+    return parser.parse_args(argv)
+
+
+def build_scraper(args):
+    """Create the scraper configured by the command line ``args``."""
+    resource_filter = None
+    if not args.no_resource_filter:
+        resource_filter = ResourceFilter(
+            blocked_types=[t.strip() for t in args.block_resource_types.split(",") if t.strip()],
+            blocked_domains=DEFAULT_BLOCKED_DOMAINS + tuple(args.block_domain),
+            allowed_domains=args.allow_domain,
+        )
+    return FloGrapplingEventScraper(
+        concurrency=args.concurrency,
+        min_request_interval=args.min_request_interval,
+        api_mode=args.api_mode,
+        resource_filter=resource_filter,
+        readiness=READINESS_STRATEGIES[args.readiness](args.ready_timeout),
+        extractor=args.extractor,
+        cache=None if args.no_cache else MonthCache(args.cache),
+        cache_policy=CachePolicy(
+            past_ttl=datetime.timedelta(days=args.past_month_ttl_days),
+            current_ttl=datetime.timedelta(hours=args.current_month_ttl_hours),
+        ),
+        debug_artifacts=DebugArtifacts(
+            mode=args.debug_artifacts,
+            image_format=args.debug_format,
+            html=args.debug_html,
+            keep=args.debug_keep,
+        ),
+        recorder=Recorder(args.record) if args.record else None,
+        replay=ReplayServer(args.replay) if args.replay else None,
+        retry_policy=RetryPolicy(attempts=args.attempts, base_delay=args.retry_base_delay),
+        circuit_breaker=CircuitBreaker(args.breaker_threshold),
+        deadline=Deadline(args.deadline),
+        month_timeout=args.month_timeout,
+        backend=args.backend,
+        install_browser=args.install_browser,
+        browser_endpoint=args.browser_endpoint,
+    )
 
 
-async def main():
-    scraper = FloGrapplingEventScraper()
-    events = await scraper.fetch_all_events()
+async def main(args=None):
+    args = args or parse_args([])
+    if args.replay:
+        args.no_cache = True
+        args.min_request_interval = 0
+        args.api_mode = "off"
+        args.event_store = ":memory:"
+        args.backend = "browser"
+    if args.api_mode == "capture":
+        # API calls can only be captured from a rendered page
+        args.backend = "browser"
+    scraper = build_scraper(args)
+    feeds = load_feeds(args.feeds)
+    store = EventStore(args.event_store)
+    
+    if args.feeds_only:
+        # Rebuild the outputs from the store; nothing is fetched, so neither
+        # Playwright nor the HTTP stack is ever imported
+        write_feeds(scraper, store, feeds, args)
+        return 0
+    if args.backfill:
+        return await backfill(scraper, store, feeds, args)
+    if args.watch:
+        return await watch(scraper, store, feeds, args)
+    return await run_once(scraper, store, feeds, args)
+
+
+async def run_once(scraper, store, feeds, args, session=None, dates=None):
+    """Scrape, merge the results into the store and rebuild the feeds.
+    
+    Returns the exit status: 1 if the circuit breaker tripped.
+    """
+    queries = unique_queries(feeds)
+    print(f"Building {len(feeds)} feeds from {len(queries)} facet queries")
+    results = await scraper.fetch_queries(queries, session=session, dates=dates)
+    
+    if scraper.breaker.tripped:
+        # The site looks down: keep serving the feeds from the last good run
+        # rather than replacing them with partial or empty ones
+        print("Too many consecutive failures, leaving the published feeds unchanged")
+        write_run_report(scraper, args)
+        return 1
+    
+    # Merge this run into the event store and build the outputs from it
+    for facets, scraped in zip(queries, results):
+        new_events = store.upsert(scraped, facets=facets)
+        print(f"Stored {len(scraped)} scraped events for {facets}, {new_events} new")
+    print(f"{store.count()} events in the store")
+    write_feeds(scraper, store, feeds, args)
+    write_run_report(scraper, args)
+    return 0
+
+
+async def backfill(scraper, store, feeds, args):
+    """Fetch the months of ``args.backfill`` over several processes, then
+    merge the spooled results into the store and rebuild the feeds."""
+    spool = Spool(args.spool)
+    if args.backfill_reset:
+        spool.reset()
+    queries = unique_queries(feeds)
+    await asyncio.to_thread(run_backfill, args, queries, spool)
+    
+    # Only this process writes to the store; merging the whole spool again
+    # after a resumed run is harmless as the upsert is idempotent
+    months = new_events = 0
+    for facets, events in spool.results():
+        new_events += store.upsert(events, facets=facets)
+        months += 1
+    print(f"Merged {months} backfilled months into the store, {new_events} new events, "
+          f"{store.count()} events in the store")
+    write_feeds(scraper, store, feeds, args)
+    return 0
+
+
+async def watch(scraper, store, feeds, args):
+    """Run forever, refreshing the current and upcoming months every
+    ``args.watch`` minutes with the browser and HTTP pool kept warm.
+    
+    The first cycle covers the whole date range.
+    """
+    session = scraper.browser_session()
+    dates = None
+    try:
+        while True:
+            status = await run_once(scraper, store, feeds, args, session=session, dates=dates)
+            if status:
+                # Start from a fresh browser in case it was the problem
+                await session.close()
+            print(f"Next refresh in {args.watch:g} minutes")
+            await asyncio.sleep(args.watch * 60)
+            scraper.new_run()
+            dates = scraper.upcoming_months()
+    finally:
+        await session.close()
+        scraper.close_http()
+
+
+def write_feeds(scraper, store, feeds, args):
+    """Write every feed and its pages from the events in the store, then
+    report which published files changed.
+    
+    Replay runs are offline measurements: they leave ``docs/`` and the
+    changes report alone.
+    """
+    if args.replay:
+        print("Replay run, leaving the published feeds unchanged")
+        return
+    window_start = datetime.date.fromisoformat(scraper.get_date_range()[0])
+    changes_since = datetime.datetime.now() - datetime.timedelta(days=args.changes_days)
     
     # Create docs directory if it doesn't exist
     os.makedirs("docs", exist_ok=True)
     
-    # Save the RSS feed in the docs directory
-    scraper.create_rss_feed(events)
-    
-    # Create a simple index.html file
-    with open("docs/index.html", "w", encoding="utf-8") as f:
-        f.write("""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>FloGrappling BJJ Events RSS Feed</title>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <style>
-                body { font-family: Arial, sans-serif; line-height: 1.6; margin: 0; padding: 20px; max-width: 800px; margin: 0 auto; }
-                header { margin-bottom: 20px; }
-                a { color: #0066cc; }
-                .feed-info { background-color: #f0f0f0; padding: 15px; border-radius: 5px; margin-bottom: 20px; }
-                .event-list { margin-top: 20px; }
-                .event-item { border-bottom: 1px solid #ddd; padding: 10px 0; }
-                .event-title { font-weight: bold; }
-                .event-date { color: #666; }
-            </style>
-        </head>
-        <body>
-            <header>
-                <h1>FloGrappling BJJ Events RSS Feed</h1>
-            </header>
-            <div class="feed-info">
-                <p>This is an automatically updated RSS feed of BJJ events from FloGrappling.</p>
-                <p>Last updated: """ + datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S UTC") + """</p>
-                <p><a href="flograppling_events.xml">Subscribe to the RSS Feed</a></p>
-            </div>
-            <div class="event-list">
-                <h2>Events Found: """ + str(len(events)) + """</h2>
-                """ + 
-                "\n".join([
-                    f"""<div class="event-item">
-                        <div class="event-title">{event['title']}</div>
-                        <div class="event-date">{event['pubDate'].strftime('%Y-%m-%d')}</div>
-                        <div>{event['description']}</div>
-                    </div>"""
-                    for event in sorted(events, key=lambda x: x['pubDate'])[:10]  # Show first 10 events
-                ]) if events else "<p>No events found in the latest scrape.</p>"
-                + """
-            </div>
-            <p>This feed is updated daily via GitHub Actions.</p>
-        </body>
-        </html>
-        """)
+    for index, feed in enumerate(feeds):
+        events = store.events(facets=feed.queries)
+        current, older = split_window(events, window_start, args.feed_max_items)
+        archives = write_feed_archives(scraper, feed, older, args, stored=events)
+        
+        # Save the RSS feed in the docs directory
+        links = [("self", args.site_url + feed.filename)]
+        if archives:
+            links.append(("prev-archive", args.site_url + feed.feed_archive_filename(archives[-1])))
+        scraper.create_rss_feed(
+            current,
+            output_path=os.path.join("docs", feed.filename),
+            title=feed.title,
+            description=feed.description,
+            # An empty main feed with archives is just quiet, not broken
+            placeholder=not archives,
+            links=links,
+        )
+        scraper.create_changes_feed(
+            store.changes(changes_since, facets=feed.queries),
+            output_path=os.path.join("docs", feed.changes_filename),
+            title=f"{feed.title}: new and updated",
+            description=f"Events added to or changed in the {feed.title} feed in the last {args.changes_days:g} days",
+        )
+        write_site("docs", feed, events, feeds, main=index == 0, site_url=args.site_url, feed_events=current)
+    
+    publisher = Publisher("docs")
+    publisher.scan()
+    if args.changes_report:
+        publisher.write_report(args.changes_report)
+
+
+def write_feed_archives(scraper, feed, events, args, stored=()):
+    """Write the events left out of the main feed as RFC 5005 archive feeds,
+    one per year or month. Returns the shard names, oldest first.
+    
+    Archive documents are meant to be stable. Items of published shards that
+    are not in ``stored``, all of the feed's events in the store (after the
+    store was rebuilt from scratch, say), are kept, so a shard does not
+    shrink and stays in the chain of links.
+    Shards of the other ``--archive-shard`` granularity are replaced, their
+    items moving to the current shards.
+    """
+    shard_format = SHARD_FORMATS[args.archive_shard]
+    shards = shard(events, args.archive_shard)
+    known = {event['guid'] for event in stored} | {event['guid'] for event in events}
+    prefix, suffix = feed.feed_archive_filename("*").split("*")
+    for path in sorted(glob.glob(os.path.join("docs", feed.feed_archive_filename("*")))):
+        lost = [event for event in read_archive(path) if event['guid'] not in known]
+        if lost:
+            print(f"Keeping {len(lost)} items of {path} that are not in the event store")
+        for event in lost:
+            known.add(event['guid'])
+            shards.setdefault(event['pubDate'].strftime(shard_format), []).append(event)
+        try:
+            datetime.datetime.strptime(os.path.basename(path)[len(prefix):-len(suffix)], shard_format)
+        except ValueError:
+            print(f"Removing archive feed {path}, replaced by {args.archive_shard} archives")
+            os.remove(path)
+    for shard_events in shards.values():
+        shard_events.sort(key=lambda event: event['pubDate'])
+    
+    names = sorted(shards)
+    
+    def url_of(name):
+        return args.site_url + feed.feed_archive_filename(name)
+    
+    for index, name in enumerate(names):
+        scraper.create_rss_feed(
+            shards[name],
+            output_path=os.path.join("docs", feed.feed_archive_filename(name)),
+            title=f"{feed.title} ({name})",
+            description=f"{feed.description}, archived: {name}",
+            placeholder=False,
+            links=archive_links(names, index, args.site_url + feed.filename, url_of),
+            archive=True,
+        )
+    return names
+
+
+def write_run_report(scraper, args):
+    """Summarize the run's metrics and write the requested reports."""
+    scraper.metrics.finish()
+    totals = scraper.metrics.totals()
+    print(f"Run took {scraper.metrics.duration}s: {totals['months']} months, "
+          f"{totals['cache_hits']} from cache, {totals['errors']} errors, "
+          f"{totals['events']} events, {totals['bytes_transferred']} bytes transferred")
+    print("Seconds per stage: " + ", ".join(f"{stage} {seconds}" for stage, seconds in totals["stage_seconds"].items()))
+    if args.metrics_json:
+        scraper.metrics.write_json(args.metrics_json)
+    if args.metrics_prom:
+        scraper.metrics.write_prometheus(args.metrics_prom)
+
+
+def run_profiled(args):
+    """Run ``main`` under cProfile and print the most expensive calls."""
+    import cProfile
+    import pstats
+    
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(asyncio.run, main(args))
+    finally:
+        os.makedirs(os.path.dirname(args.profile) or ".", exist_ok=True)
+        profiler.dump_stats(args.profile)
+        print(f"Profile written to {args.profile}")
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    args = parse_args()
+    if args.profile:
+        sys.exit(run_profiled(args))
+    else:
+        sys.exit(asyncio.run(main(args)))
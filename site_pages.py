@@ -0,0 +1,261 @@
+"""Static HTML pages and JSON feeds built next to the RSS feeds in ``docs/``.
+
+Every feed gets a front page listing its next upcoming events and an index
+of months, paginated per-month archive pages, and a JSON Feed
+(https://jsonfeed.org) with the same items as the RSS feed. Pages are
+rendered from precompiled templates with every event field escaped. Like the
+RSS feed, a page is only rewritten when its content changed: a hash of the
+page without its "Last updated" line is kept in a trailing comment.
+"""
+import datetime
+import glob
+import hashlib
+import heapq
+import html
+import json
+import os
+import string
+import tempfile
+
+from feed_writer import HASH_MARKER, stored_content_hash
+
+SITE_URL = "https://frankt86.github.io/Flo-event-rss/"
+EVENTS_URL = "https://www.flograppling.com/events"
+
+# Upcoming events shown on a feed's front page
+FRONT_PAGE_EVENTS = 10
+# Events per archive page before a month is split into several pages
+ARCHIVE_PAGE_SIZE = 50
+
+PAGE = string.Template("""<!DOCTYPE html>
+<html>
+<head>
+    <title>$title</title>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <style>
+        body { font-family: Arial, sans-serif; line-height: 1.6; margin: 0; padding: 20px; max-width: 800px; margin: 0 auto; }
+        header { margin-bottom: 20px; }
+        a { color: #0066cc; }
+        .feed-info { background-color: #f0f0f0; padding: 15px; border-radius: 5px; margin-bottom: 20px; }
+        .event-list { margin-top: 20px; }
+        .event-item { border-bottom: 1px solid #ddd; padding: 10px 0; }
+        .event-title { font-weight: bold; }
+        .event-date { color: #666; }
+        .pager { margin-top: 20px; }
+    </style>
+</head>
+<body>
+    <header>
+        <h1>$heading</h1>
+    </header>
+$body
+    <p>This feed is updated daily via GitHub Actions.</p>
+</body>
+</html>
+""")
+
+FEED_INFO = string.Template("""    <div class="feed-info">
+        <p>This is an automatically updated RSS feed: $description.</p>
+        <p>Last updated: $updated</p>
+        <p><a href="$rss">Subscribe to the RSS Feed</a> or use the <a href="$json">JSON Feed</a></p>
+        <p>Only want what is new? Follow the <a href="$changes">feed of new and updated events</a>.</p>
+$other_feeds
+    </div>
+""")
+
+EVENT_LIST = string.Template("""    <div class="event-list">
+        <h2>$heading</h2>
+$items
+    </div>
+""")
+
+EVENT_ITEM = string.Template("""        <div class="event-item">
+            <div class="event-title"><a href="$link">$title</a></div>
+            <div class="event-date">$date</div>
+            <div>$location</div>
+        </div>""")
+
+PAGER = string.Template("""    <p class="pager">$links</p>
+""")
+
+
+def _event_items(events):
+    return "\n".join(
+        EVENT_ITEM.substitute(
+            link=html.escape(event['link']),
+            title=html.escape(event['title']),
+            date=event['pubDate'].strftime("%Y-%m-%d %H:%M UTC"),
+            location=html.escape(event.get('location', '')),
+        )
+        for event in events
+    )
+
+
+def _event_list(heading, events, empty):
+    items = _event_items(events) if events else f"        <p>{html.escape(empty)}</p>"
+    return EVENT_LIST.substitute(heading=html.escape(heading), items=items)
+
+
+def _write_atomic(path, text):
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix=".page-", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as f:
+            f.write(text)
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+def write_page(path, render):
+    """Write ``render(updated)`` to ``path`` unless the page is unchanged.
+
+    ``render`` is called with an empty string to hash the page independently
+    of its timestamp. Returns True if the file was written.
+    """
+    content_hash = hashlib.sha256(render("").encode("utf-8")).hexdigest()
+    if stored_content_hash(path) == content_hash:
+        return False
+    updated = datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+    _write_atomic(path, render(updated) + f"{HASH_MARKER}{content_hash} -->\n")
+    return True
+
+
+def events_by_month(events):
+    """Group events by ``YYYY-MM`` of their date, keeping their order."""
+    months = {}
+    for event in events:
+        months.setdefault(event['pubDate'].strftime("%Y-%m"), []).append(event)
+    return months
+
+
+def upcoming(events, count=FRONT_PAGE_EVENTS, now=None):
+    """The ``count`` soonest events that have not started yet."""
+    now = now or datetime.datetime.now(datetime.timezone.utc)
+    return heapq.nsmallest(
+        count, (event for event in events if event['pubDate'] >= now), key=lambda event: event['pubDate']
+    )
+
+
+def write_front_page(directory, feed, events, feeds, months, main=False):
+    """A feed's page: its next events and links to the monthly archives."""
+    other_feeds = "".join(
+        f'<li><a href="{html.escape(other.page_filename(main=i == 0))}">{html.escape(other.title)}</a> '
+        f'(<a href="{html.escape(other.filename)}">RSS</a>)</li>'
+        for i, other in enumerate(feeds) if other is not feed
+    )
+    archive_links = "\n".join(
+        f'        <li><a href="{html.escape(feed.archive_filename(month))}">{month}</a> '
+        f'({len(month_events)} events)</li>'
+        for month, month_events in sorted(months.items(), reverse=True)
+    )
+    next_events = upcoming(events)
+
+    def render(updated):
+        body = FEED_INFO.substitute(
+            description=html.escape(feed.description),
+            updated=updated,
+            rss=html.escape(feed.filename),
+            json=html.escape(feed.json_filename),
+            changes=html.escape(feed.changes_filename),
+            other_feeds=f"        <p>Other feeds:</p><ul>{other_feeds}</ul>" if other_feeds else "",
+        )
+        body += _event_list(f"Upcoming Events ({len(events)} events tracked)", next_events,
+                            "No upcoming events found in the latest scrape.")
+        if archive_links:
+            body += EVENT_LIST.substitute(heading="Archive", items=f"        <ul>\n{archive_links}\n        </ul>")
+        title = html.escape(f"{feed.title} RSS Feed")
+        return PAGE.substitute(title=title, heading=title, body=body)
+
+    return write_page(os.path.join(directory, feed.page_filename(main=main)), render)
+
+
+def write_archive_pages(directory, feed, months, main=False, page_size=ARCHIVE_PAGE_SIZE):
+    """One page per month, split every ``page_size`` events. Returns the number written.
+
+    Extra pages left from when a month had more events are removed. Months
+    missing from ``months`` altogether keep their pages, as with archive feeds.
+    """
+    written = 0
+    produced = set()
+    home = html.escape(feed.page_filename(main=main))
+    for month, month_events in months.items():
+        pages = [month_events[start:start + page_size] for start in range(0, len(month_events), page_size)]
+        for number, page_events in enumerate(pages, start=1):
+            links = [f'<a href="{home}">{html.escape(feed.title)}</a>']
+            if number > 1:
+                links.append(f'<a href="{html.escape(feed.archive_filename(month, number - 1))}">Previous page</a>')
+            if number < len(pages):
+                links.append(f'<a href="{html.escape(feed.archive_filename(month, number + 1))}">Next page</a>')
+            heading = f"{feed.title}: {month}"
+            if len(pages) > 1:
+                heading += f" (page {number} of {len(pages)})"
+
+            def render(updated, page_events=page_events, heading=heading, links=links):
+                body = _event_list(f"{len(page_events)} events", page_events, "No events.")
+                body += PAGER.substitute(links=" | ".join(links))
+                return PAGE.substitute(title=html.escape(heading), heading=html.escape(heading), body=body)
+
+            path = os.path.join(directory, feed.archive_filename(month, number))
+            produced.add(path)
+            written += write_page(path, render)
+        for path in glob.glob(os.path.join(directory, feed.archive_filename(month, "*"))):
+            if path not in produced:
+                print(f"Removing archive page {path}")
+                os.remove(path)
+    return written
+
+
+def json_feed(feed, events, site_url=SITE_URL):
+    """The feed as a JSON Feed 1.1 document."""
+    return {
+        "version": "https://jsonfeed.org/version/1.1",
+        "title": feed.title,
+        "home_page_url": EVENTS_URL,
+        "feed_url": site_url + feed.json_filename,
+        "description": feed.description,
+        "items": [
+            {
+                "id": event['guid'],
+                "url": event['link'],
+                "title": event['title'],
+                "content_html": event['description'],
+                "date_published": event['pubDate'].isoformat(),
+                "_flo_event_rss": {"location": event.get('location', '')},
+            }
+            for event in events
+        ],
+    }
+
+
+def write_json_feed(path, feed, events, site_url=SITE_URL):
+    """Write the JSON Feed unless it is unchanged. Returns True if written."""
+    text = json.dumps(json_feed(feed, events, site_url), indent=1, ensure_ascii=False) + "\n"
+    try:
+        with open(path, encoding="utf-8") as f:
+            if f.read() == text:
+                return False
+    except OSError:
+        pass
+    _write_atomic(path, text)
+    return True
+
+
+def write_site(directory, feed, events, feeds, main=False, site_url=SITE_URL, feed_events=None):
+    """Write a feed's front page, archive pages and JSON Feed.
+
+    ``feed_events`` are the items of the main RSS feed, mirrored by the JSON
+    Feed; the pages cover all of ``events``.
+    """
+    months = events_by_month(events)
+    front = write_front_page(directory, feed, events, feeds, months, main=main)
+    archives = write_archive_pages(directory, feed, months, main=main)
+    json_written = write_json_feed(
+        os.path.join(directory, feed.json_filename), feed, events if feed_events is None else feed_events, site_url
+    )
+    print(f"Pages for {feed.slug}: front page {'updated' if front else 'unchanged'}, "
+          f"{archives} archive pages updated, JSON Feed {'updated' if json_written else 'unchanged'}")